@@ -11,6 +11,10 @@ class EmbeddingSettings(BaseSettings):
     
     model: str = Field(default="openai/text-embedding-3-small", description="Embedding model")
     dimension: int = Field(default=1536, description="Embedding dimension")
+    quantization: Literal["fp32", "fp16", "int8"] = Field(
+        default="fp32",
+        description="Vector storage precision for new Zilliz collections (existing collections keep theirs)"
+    )
     
     model_config = SettingsConfigDict(env_prefix="EMBEDDING_")
 
@@ -85,6 +89,7 @@ class RerankSettings(BaseSettings):
     model: str = Field(default="rerank-v4.0-fast", description="Cohere rerank model")
     top_n: int = Field(default=3, ge=1, le=10, description="Number of chunks to keep after reranking")
     initial_top_k: int = Field(default=5, ge=3, le=20, description="Number of chunks to retrieve before reranking")
+    force_reorder: bool = Field(default=False, description="Call the rerank API even when there are no more candidates than top_n")
     
     model_config = SettingsConfigDict(env_prefix="RERANK_")
 
@@ -125,6 +130,50 @@ class Settings(BaseSettings):
     zilliz_token: Optional[str] = Field(default=None, description="Zilliz Cloud API token")
     zilliz_collection_name: str = Field(default="documents", description="Zilliz collection name")
     use_zilliz: bool = Field(default=True, description="Use Zilliz Cloud for vector storage (recommended for production)")
+    zilliz_insert_batch_size: int = Field(
+        default=200,
+        ge=10,
+        le=1000,
+        description="Number of chunks sent per Zilliz insert call"
+    )
+    zilliz_insert_workers: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Concurrent insert threads used by add_documents_async"
+    )
+    zilliz_catalog_path: Path = Field(
+        default=Path("./data/documents_catalog.db"),
+        description="SQLite file caching one metadata row per Zilliz document (delete to force a rescan); "
+                    "the URI and collection are hashed into the actual file name"
+    )
+    zilliz_catalog_ttl: int = Field(
+        default=300,
+        ge=0,
+        description="Seconds between checks of the collection row count against the document catalog (0 disables)"
+    )
+    zilliz_index_type: Literal["AUTOINDEX", "HNSW"] = Field(
+        default="AUTOINDEX",
+        description="Vector index built for new Zilliz collections"
+    )
+    zilliz_hnsw_m: int = Field(
+        default=16,
+        ge=4,
+        le=64,
+        description="HNSW graph connectivity (M), used when ZILLIZ_INDEX_TYPE=HNSW"
+    )
+    zilliz_hnsw_ef_construction: int = Field(
+        default=64,
+        ge=8,
+        le=512,
+        description="HNSW build-time candidate list size (efConstruction)"
+    )
+    zilliz_hnsw_ef: int = Field(
+        default=100,
+        ge=1,
+        le=1024,
+        description="HNSW search-time candidate list size (ef); must be >= top_k"
+    )
     
     # API Endpoints
     api_base_url: Optional[str] = Field(
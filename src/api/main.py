@@ -18,9 +18,11 @@ if sys.platform == "win32":
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from config.settings import settings
-from src.api.routes import chat, conversations, documents, search
+from src.api.middleware import ETagMiddleware
+from src.api.routes import chat, conversations, documents, search, ui
 from src.api.schemas import HealthResponse
 
 # Configure logging
@@ -88,11 +90,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Let clients revalidate document lists and chunk pages with If-None-Match
+# (added before gzip so the ETag hashes the uncompressed body)
+app.add_middleware(ETagMiddleware, path_prefixes=["/documents"])
+
+# Compress JSON responses (document and conversation lists, chunk pages);
+# SSE chat streams are excluded by default so tokens still flush immediately
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Include routers
 app.include_router(documents.router)
 app.include_router(search.router)
 app.include_router(chat.router)
 app.include_router(conversations.router)
+app.include_router(ui.router)
 
 
 @app.get("/", response_model=HealthResponse)
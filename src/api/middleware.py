@@ -0,0 +1,69 @@
+"""Custom ASGI middleware for the API."""
+import hashlib
+from typing import Iterable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ETagMiddleware:
+    """
+    Add weak ETags to GET responses under the given path prefixes.
+
+    The ETag is a hash of the response body, so handlers need no changes.
+    A request whose If-None-Match matches gets an empty 304 instead of the
+    body, which saves the transfer and the client's JSON decode. Responses
+    are buffered, so only mount this on JSON endpoints, not streams.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefixes: Iterable[str]):
+        self.app = app
+        self.path_prefixes = tuple(path_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.path_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match", "")
+        start_message: Message = {}
+        body_parts = []
+
+        async def buffered_send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                start_message.update(message)
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            if start_message["status"] != 200:
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body})
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            headers["ETag"] = etag
+            headers["Cache-Control"] = "private, no-cache"
+
+            if etag in (tag.strip() for tag in if_none_match.split(",")):
+                del headers["Content-Length"]
+                del headers["Content-Type"]
+                await send({**start_message, "status": 304})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, buffered_send)
@@ -1,5 +1,7 @@
 """Chat/Q&A routes."""
+import json
 import logging
+from typing import Dict, List
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
@@ -7,7 +9,7 @@ from fastapi.responses import StreamingResponse
 from src.api.schemas import ChatRequest, ChatResponse, SourceCitation
 from src.embedding.embedder import get_embedder
 from src.generation.llm import get_generator
-from src.retrieval.bm25_retriever import BM25Retriever
+from src.retrieval.bm25_retriever import get_bm25_retriever
 from src.retrieval.hybrid_retriever import HybridRetriever
 from src.retrieval.vector_retriever import VectorRetriever
 from src.retrieval.reranker import CohereReranker
@@ -18,9 +20,6 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
-# Cache for BM25 retriever to avoid loading all documents every request
-_bm25_cache = {"retriever": None, "last_count": 0}
-
 
 def _initialize_retrievers():
     """Initialize retrievers for chat."""
@@ -30,27 +29,8 @@ def _initialize_retrievers():
     # Vector retriever
     vector_retriever = VectorRetriever(vector_store, embedder)
     
-    # BM25 retriever with caching to reduce memory usage
-    bm25_retriever = BM25Retriever()
-    current_count = vector_store.count()
-    
-    # Only re-index if collection count changed or cache is empty
-    if _bm25_cache["retriever"] is None or _bm25_cache["last_count"] != current_count:
-        logger.info(f"Initializing BM25 index (collection count: {current_count})")
-        # Limit document fetch to reduce memory spike using settings
-        max_cache = getattr(settings, 'max_documents_cache', 5000)
-        all_results = vector_store.get(limit=min(current_count, max_cache))
-        if all_results["documents"]:
-            documents = [
-                {"text": text, "metadata": metadata}
-                for text, metadata in zip(all_results["documents"], all_results["metadatas"])
-            ]
-            bm25_retriever.index_documents(documents)
-            _bm25_cache["retriever"] = bm25_retriever
-            _bm25_cache["last_count"] = current_count
-    else:
-        logger.debug("Using cached BM25 retriever")
-        bm25_retriever = _bm25_cache["retriever"]
+    # BM25 retriever (cached until the collection changes)
+    bm25_retriever = get_bm25_retriever(vector_store)
     
     # Hybrid retriever
     hybrid_retriever = HybridRetriever(
@@ -71,6 +51,123 @@ def _initialize_retrievers():
     return vector_retriever, bm25_retriever, hybrid_retriever, reranker
 
 
+def _prepare_chat(request: ChatRequest):
+    """
+    Load conversation context and retrieve the chunks to answer from.
+    
+    Args:
+        request: Chat request
+        
+    Returns:
+        Tuple of (generator, conversation_history, retrieved_chunks)
+        
+    Raises:
+        HTTPException: 404 if no relevant chunks were found
+    """
+    # Initialize components
+    vector_retriever, bm25_retriever, hybrid_retriever, reranker = _initialize_retrievers()
+    # Determine model based on mode
+    model_name = settings.llm.model_light if request.model_mode == "light" else settings.llm.model
+    generator = get_generator(model_name=model_name)
+    
+    # Load conversation history if conversation_id provided
+    conversation_history = []
+    if request.conversation_id:
+        from src.storage.conversation_storage import get_conversation_storage
+        storage = get_conversation_storage()
+        recent_messages = storage.get_recent_messages(request.conversation_id, limit=10)
+        conversation_history = [
+            {"role": msg.role, "content": msg.content}
+            for msg in recent_messages
+        ]
+    
+    # Resolve coreferences if we have history
+    query_to_use = request.query
+    if conversation_history:
+        from src.generation.context_resolver import get_context_resolver
+        resolver = get_context_resolver()
+        query_to_use = resolver.resolve(request.query, conversation_history)
+    
+    # Determine retrieval top_k
+    retrieval_k = request.top_k
+    if reranker and settings.rerank.enabled:
+        # If reranking, retrieve more initially
+        retrieval_k = max(request.top_k, settings.rerank.initial_top_k)
+    
+    # Retrieve relevant chunks using resolved query
+    if request.search_type == "vector":
+        retrieved_chunks = vector_retriever.retrieve(query_to_use, top_k=retrieval_k)
+    elif request.search_type == "bm25":
+        retrieved_chunks = bm25_retriever.retrieve(query_to_use, top_k=retrieval_k)
+    else:  # hybrid
+        retrieved_chunks = hybrid_retriever.retrieve(query_to_use, top_k=retrieval_k)
+        
+    # Apply reranking if enabled
+    if reranker and settings.rerank.enabled and retrieved_chunks:
+        logger.info(f"Applying reranking to {len(retrieved_chunks)} chunks")
+        retrieved_chunks = reranker.rerank(query_to_use, retrieved_chunks)
+        # Ensure we respect the requested top_k from rerank results
+        retrieved_chunks = retrieved_chunks[:request.top_k]
+    
+    if not retrieved_chunks:
+        raise HTTPException(
+            status_code=404,
+            detail="No relevant documents found. Please upload documents first."
+        )
+    
+    return generator, conversation_history, retrieved_chunks
+
+
+def _save_exchange(
+    request: ChatRequest,
+    conversation_history: List[Dict],
+    answer: str,
+    citations: List[Dict]
+):
+    """
+    Save the question and answer to the request's conversation, if any.
+    
+    Args:
+        request: Chat request
+        conversation_history: History loaded before answering
+        answer: Generated answer
+        citations: Extracted source citations
+    """
+    if not request.conversation_id:
+        return
+    
+    from src.storage.conversation_storage import get_conversation_storage
+    storage = get_conversation_storage()
+    
+    # Update title with first query if it's using the default title
+    if not conversation_history:
+        conv = storage.get_conversation(request.conversation_id)
+        if conv and (conv.title == "New Conversation" or conv.title.startswith("Conversation ") or not conv.title):
+            new_title = request.query[:20]
+            if len(request.query) > 20:
+                new_title += "..."
+            storage.update_conversation_title(request.conversation_id, new_title)
+
+    # Save user message
+    storage.add_message(
+        conversation_id=request.conversation_id,
+        role="user",
+        content=request.query
+    )
+    # Save assistant response
+    storage.add_message(
+        conversation_id=request.conversation_id,
+        role="assistant",
+        content=answer,
+        sources=citations
+    )
+
+
+def _sse(payload: Dict) -> str:
+    """Encode one server-sent event data frame."""
+    return f"data: {json.dumps(payload)}\n\n"
+
+
 @router.post("", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     """
@@ -83,56 +180,7 @@ async def chat(request: ChatRequest):
         Generated answer with source citations
     """
     try:
-        # Initialize components
-        vector_retriever, bm25_retriever, hybrid_retriever, reranker = _initialize_retrievers()
-        # Determine model based on mode
-        model_name = settings.llm.model_light if request.model_mode == "light" else settings.llm.model
-        generator = get_generator(model_name=model_name)
-        
-        # Load conversation history if conversation_id provided
-        conversation_history = []
-        if request.conversation_id:
-            from src.storage.conversation_storage import get_conversation_storage
-            storage = get_conversation_storage()
-            recent_messages = storage.get_recent_messages(request.conversation_id, limit=10)
-            conversation_history = [
-                {"role": msg.role, "content": msg.content}
-                for msg in recent_messages
-            ]
-        
-        # Resolve coreferences if we have history
-        query_to_use = request.query
-        if conversation_history:
-            from src.generation.context_resolver import get_context_resolver
-            resolver = get_context_resolver()
-            query_to_use = resolver.resolve(request.query, conversation_history)
-        
-        # Determine retrieval top_k
-        retrieval_k = request.top_k
-        if reranker and settings.rerank.enabled:
-            # If reranking, retrieve more initially
-            retrieval_k = max(request.top_k, settings.rerank.initial_top_k)
-        
-        # Retrieve relevant chunks using resolved query
-        if request.search_type == "vector":
-            retrieved_chunks = vector_retriever.retrieve(query_to_use, top_k=retrieval_k)
-        elif request.search_type == "bm25":
-            retrieved_chunks = bm25_retriever.retrieve(query_to_use, top_k=retrieval_k)
-        else:  # hybrid
-            retrieved_chunks = hybrid_retriever.retrieve(query_to_use, top_k=retrieval_k)
-            
-        # Apply reranking if enabled
-        if reranker and settings.rerank.enabled and retrieved_chunks:
-            logger.info(f"Applying reranking to {len(retrieved_chunks)} chunks")
-            retrieved_chunks = reranker.rerank(query_to_use, retrieved_chunks)
-            # Ensure we respect the requested top_k from rerank results
-            retrieved_chunks = retrieved_chunks[:request.top_k]
-        
-        if not retrieved_chunks:
-            raise HTTPException(
-                status_code=404,
-                detail="No relevant documents found. Please upload documents first."
-            )
+        generator, conversation_history, retrieved_chunks = _prepare_chat(request)
         
         # Generate answer with conversation history
         answer = generator.generate(
@@ -157,32 +205,7 @@ async def chat(request: ChatRequest):
         ]
         
         # Save messages to conversation if conversation_id provided
-        if request.conversation_id:
-            from src.storage.conversation_storage import get_conversation_storage
-            storage = get_conversation_storage()
-            
-            # Update title with first query if it's using the default title
-            if not conversation_history:
-                conv = storage.get_conversation(request.conversation_id)
-                if conv and (conv.title == "New Conversation" or conv.title.startswith("Conversation ") or not conv.title):
-                    new_title = request.query[:20]
-                    if len(request.query) > 20:
-                        new_title += "..."
-                    storage.update_conversation_title(request.conversation_id, new_title)
-
-            # Save user message
-            storage.add_message(
-                conversation_id=request.conversation_id,
-                role="user",
-                content=request.query
-            )
-            # Save assistant response
-            storage.add_message(
-                conversation_id=request.conversation_id,
-                role="assistant",
-                content=answer,
-                sources=citations
-            )
+        _save_exchange(request, conversation_history, answer, citations)
         
         logger.info(f"Chat response generated for query: '{request.query[:50]}...'")
         
@@ -203,61 +226,51 @@ async def chat(request: ChatRequest):
 @router.post("/stream")
 async def chat_stream(request: ChatRequest):
     """
-    Stream chat response.
+    Stream a chat answer as server-sent events.
+    
+    Each event is a ``data:`` line holding JSON: ``{"token": ...}`` for each
+    piece of the answer, then ``{"done": true, "sources": [...]}`` once the
+    answer is complete and saved (or ``{"error": ...}`` if generation fails).
     
     Args:
-        request: Chat request with question
+        request: Chat request with question and optional conversation_id
         
     Returns:
-        Streaming response
+        text/event-stream response
     """
     try:
-        # Initialize components
-        vector_retriever, bm25_retriever, hybrid_retriever, reranker = _initialize_retrievers()
-        # Determine model based on mode
-        model_name = settings.llm.model_light if request.model_mode == "light" else settings.llm.model
-        generator = get_generator(model_name=model_name)
-        
-        # Determine retrieval top_k
-        retrieval_k = request.top_k
-        if reranker and settings.rerank.enabled:
-            # If reranking, retrieve more initially
-            retrieval_k = max(request.top_k, settings.rerank.initial_top_k)
-            
-        # Retrieve relevant chunks
-        if request.search_type == "vector":
-            retrieved_chunks = vector_retriever.retrieve(request.query, top_k=retrieval_k)
-        elif request.search_type == "bm25":
-            retrieved_chunks = bm25_retriever.retrieve(request.query, top_k=retrieval_k)
-        else:  # hybrid
-            retrieved_chunks = hybrid_retriever.retrieve(request.query, top_k=retrieval_k)
-            
-        # Apply reranking if enabled
-        if reranker and settings.rerank.enabled and retrieved_chunks:
-            logger.info(f"Applying reranking (stream) to {len(retrieved_chunks)} chunks")
-            retrieved_chunks = reranker.rerank(request.query, retrieved_chunks)
-            # Ensure we respect the requested top_k from rerank results
-            retrieved_chunks = retrieved_chunks[:request.top_k]
-        
-        if not retrieved_chunks:
-            raise HTTPException(
-                status_code=404,
-                detail="No relevant documents found. Please upload documents first."
-            )
-        
-        # Generate streaming response
-        def generate_stream():
-            for chunk in generator.generate(
-                query=request.query,
-                retrieved_chunks=retrieved_chunks,
-                stream=True
-            ):
-                yield chunk
-        
-        return StreamingResponse(generate_stream(), media_type="text/plain")
-        
+        generator, conversation_history, retrieved_chunks = _prepare_chat(request)
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error in streaming chat: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    
+    def event_stream():
+        answer_parts = []
+        try:
+            for token in generator.generate(
+                query=request.query,
+                retrieved_chunks=retrieved_chunks,
+                stream=True,
+                conversation_history=conversation_history
+            ):
+                answer_parts.append(token)
+                yield _sse({"token": token})
+            
+            answer = "".join(answer_parts)
+            citations = generator.extract_citations(answer, retrieved_chunks)
+            _save_exchange(request, conversation_history, answer, citations)
+            
+            sources = [SourceCitation(**citation).model_dump() for citation in citations]
+            yield _sse({"done": True, "sources": sources})
+        except Exception as e:
+            logger.error(f"Error in streaming chat: {e}")
+            yield _sse({"error": str(e)})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        # Keep proxies from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
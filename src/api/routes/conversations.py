@@ -1,7 +1,7 @@
 """Conversation management routes."""
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from src.api.schemas import (
     ConversationCreate,
@@ -45,47 +45,63 @@ async def create_conversation(request: ConversationCreate = None):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _list_conversations(limit: int, offset: int) -> ConversationListResponse:
+    """Build the conversation list (blocking; shared with the UI bootstrap route)."""
+    storage = get_conversation_storage()
+    conversations = storage.list_conversations(limit=limit, offset=offset)
+    total = storage.count_conversations()
+    
+    return ConversationListResponse(
+        conversations=[
+            ConversationResponse(
+                id=conv.id,
+                title=conv.title,
+                messages=[],
+                created_at=conv.created_at,
+                updated_at=conv.updated_at
+            )
+            for conv in conversations
+        ],
+        total=total
+    )
+
+
 @router.get("", response_model=ConversationListResponse)
-async def list_conversations(limit: int = 50):
+async def list_conversations(limit: int = 50, offset: int = 0):
     """
-    List all conversations.
+    List all conversations, most recently updated first.
     
     Args:
         limit: Maximum number of conversations to return
+        offset: Number of conversations to skip (for pagination)
         
     Returns:
         List of conversations (without messages)
     """
     try:
-        storage = get_conversation_storage()
-        conversations = storage.list_conversations(limit=limit)
-        total = storage.count_conversations()
-        
-        return ConversationListResponse(
-            conversations=[
-                ConversationResponse(
-                    id=conv.id,
-                    title=conv.title,
-                    messages=[],
-                    created_at=conv.created_at,
-                    updated_at=conv.updated_at
-                )
-                for conv in conversations
-            ],
-            total=total
-        )
+        return _list_conversations(limit, offset)
     except Exception as e:
         logger.error(f"Error listing conversations: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _conversation_etag(conversation) -> str:
+    """Weak ETag for a conversation; changes whenever a message is added or it is renamed."""
+    return f'W/"{conversation.id}-{conversation.updated_at.timestamp()}-{len(conversation.messages)}"'
+
+
 @router.get("/{conversation_id}", response_model=ConversationResponse)
-async def get_conversation(conversation_id: str):
+async def get_conversation(conversation_id: str, request: Request, response: Response):
     """
     Get a conversation with all its messages.
     
+    Responds 304 Not Modified when the client's If-None-Match header still
+    matches, so clients re-validating a cached copy skip the message payload.
+    
     Args:
         conversation_id: ID of the conversation
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
         
     Returns:
         Conversation with messages
@@ -97,6 +113,11 @@ async def get_conversation(conversation_id: str):
         if not conversation:
             raise HTTPException(status_code=404, detail="Conversation not found")
         
+        etag = _conversation_etag(conversation)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        
         return ConversationResponse(
             id=conversation.id,
             title=conversation.title,
@@ -3,12 +3,13 @@ import logging
 import shutil
 import os
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi import APIRouter, File, HTTPException, Query, UploadFile
 
 from config.settings import settings
 from src.api.schemas import (
+    ChunkInfo,
     DocumentChunksResponse,
     DocumentDeleteResponse,
     DocumentInfo,
@@ -25,6 +26,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
+# Largest page the chunks endpoint serves (omit limit to get every chunk)
+MAX_CHUNK_PAGE_SIZE = 500
+
 
 @router.post("/upload", response_model=DocumentUploadResponse)
 async def upload_document(file: UploadFile = File(...)):
@@ -168,7 +172,7 @@ async def upload_document(file: UploadFile = File(...)):
         
         # Store in vector database
         vector_store = get_vector_store()
-        document_id = vector_store.add_documents(chunks, embeddings)
+        document_id = await vector_store.add_documents_async(chunks, embeddings)
         
         # Save chunks to Supabase if using it
         if use_supabase and supabase_doc_id:
@@ -210,6 +214,52 @@ async def upload_document(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _list_documents() -> DocumentListResponse:
+    """Build the document list (blocking; shared with the UI bootstrap route)."""
+    # Always use Supabase + Zilliz in production
+    use_supabase = settings.environment == "production" or settings.use_supabase_storage
+        
+    if use_supabase and settings.supabase_url and settings.supabase_key:
+        # Get documents from Supabase
+        from src.storage.supabase_client import get_supabase_storage
+        supabase_storage = get_supabase_storage()
+        
+        supabase_docs = supabase_storage.list_documents()
+        
+        # Convert Supabase format to DocumentInfo format
+        doc_infos = []
+        for doc in supabase_docs:
+            doc_info = DocumentInfo(
+                document_id=doc['id'],
+                filename=doc['filename'],
+                file_type=doc.get('file_type'),
+                upload_timestamp=doc.get('upload_date'),
+                authors=doc.get('metadata', {}).get('authors'),
+                year=doc.get('metadata', {}).get('year'),
+                keywords=doc.get('metadata', {}).get('keywords'),
+                abstract=doc.get('metadata', {}).get('abstract'),
+                doi=doc.get('metadata', {}).get('doi'),
+                arxiv_id=doc.get('metadata', {}).get('arxiv_id'),
+                venue=doc.get('metadata', {}).get('venue')
+            )
+            doc_infos.append(doc_info)
+        
+        logger.info(f"✅ Retrieved {len(doc_infos)} documents from Supabase")
+        return DocumentListResponse(documents=doc_infos, total=len(doc_infos))
+    
+    # Get documents from Zilliz (fallback for local development)
+    vector_store = get_vector_store()
+    documents = vector_store.get_all_documents()
+    
+    # Documents already include rich metadata from get_all_documents()
+    doc_infos = [DocumentInfo(**doc) for doc in documents]
+    
+    return DocumentListResponse(
+        documents=doc_infos,
+        total=len(doc_infos)
+    )
+
+
 @router.get("", response_model=DocumentListResponse)
 async def list_documents():
     """
@@ -219,49 +269,7 @@ async def list_documents():
         List of documents with metadata
     """
     try:
-        # Always use Supabase + Zilliz in production
-        use_supabase = settings.environment == "production" or settings.use_supabase_storage
-        
-        if use_supabase and settings.supabase_url and settings.supabase_key:
-            # Get documents from Supabase
-            from src.storage.supabase_client import get_supabase_storage
-            supabase_storage = get_supabase_storage()
-            
-            supabase_docs = supabase_storage.list_documents()
-            
-            # Convert Supabase format to DocumentInfo format
-            doc_infos = []
-            for doc in supabase_docs:
-                doc_info = DocumentInfo(
-                    document_id=doc['id'],
-                    filename=doc['filename'],
-                    file_type=doc.get('file_type'),
-                    upload_timestamp=doc.get('upload_date'),
-                    authors=doc.get('metadata', {}).get('authors'),
-                    year=doc.get('metadata', {}).get('year'),
-                    keywords=doc.get('metadata', {}).get('keywords'),
-                    abstract=doc.get('metadata', {}).get('abstract'),
-                    doi=doc.get('metadata', {}).get('doi'),
-                    arxiv_id=doc.get('metadata', {}).get('arxiv_id'),
-                    venue=doc.get('metadata', {}).get('venue')
-                )
-                doc_infos.append(doc_info)
-            
-            logger.info(f"✅ Retrieved {len(doc_infos)} documents from Supabase")
-            return DocumentListResponse(documents=doc_infos, total=len(doc_infos))
-        
-        # Get documents from Zilliz (fallback for local development)
-        vector_store = get_vector_store()
-        documents = vector_store.get_all_documents()
-        
-        # Documents already include rich metadata from get_all_documents()
-        doc_infos = [DocumentInfo(**doc) for doc in documents]
-        
-        return DocumentListResponse(
-            documents=doc_infos,
-            total=len(doc_infos)
-        )
-        
+        return _list_documents()
     except Exception as e:
         logger.error(f"Error listing documents: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -320,16 +328,47 @@ async def delete_document(document_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _preview_text(text: str, preview_chars: Optional[int]) -> str:
+    """
+    Make a one-line preview of at most preview_chars characters.
+
+    Whitespace runs are collapsed, and a truncated preview ends on a word
+    boundary (unless a single word exceeds the limit), marked with "...".
+    """
+    if preview_chars is None or text is None:
+        return text
+    if len(text) <= preview_chars:
+        return " ".join(text.split())
+    # One extra character shows whether the last word was cut mid-way
+    head = text[:preview_chars + 1]
+    words = head.split()
+    if len(words) > 1 and not head[-1].isspace():
+        words.pop()
+    return " ".join(words)[:preview_chars] + "..."
+
+
 @router.get("/{document_id}/chunks", response_model=DocumentChunksResponse)
-async def get_document_chunks(document_id: str):
+async def get_document_chunks(
+    document_id: str,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_CHUNK_PAGE_SIZE),
+    preview_chars: Optional[int] = Query(None, ge=1)
+):
     """
-    Get all chunks for a specific document.
+    Get chunks for a specific document, optionally one page at a time.
     
     Args:
         document_id: Document ID to retrieve chunks for
+        offset: Index of the first chunk to return
+        limit: Maximum number of chunks to return, up to MAX_CHUNK_PAGE_SIZE
+            (omit for all)
+        preview_chars: Return a one-line preview of each chunk's text, cut at
+            a word boundary within this many characters (marked with
+            "..."); fetch a single chunk for the full text
         
     Returns:
-        List of chunks with text and metadata
+        List of chunks with text and metadata; total is the document's
+        full chunk count
     """
     try:
         # Always use Supabase + Zilliz
@@ -340,9 +379,13 @@ async def get_document_chunks(document_id: str):
             from src.storage.supabase_client import get_supabase_storage
             supabase_storage = get_supabase_storage()
             
-            supabase_chunks = supabase_storage.get_document_chunks(document_id)
+            supabase_chunks = supabase_storage.get_document_chunks(document_id, offset=offset, limit=limit)
+            if limit is None and not offset:
+                total = len(supabase_chunks)
+            else:
+                total = supabase_storage.count_document_chunks(document_id)
             
-            if not supabase_chunks:
+            if not total:
                 raise HTTPException(status_code=404, detail="Document not found or has no chunks")
             
             # Convert to expected format
@@ -350,7 +393,7 @@ async def get_document_chunks(document_id: str):
             for chunk in supabase_chunks:
                 chunks.append({
                     "chunk_id": chunk['id'],
-                    "text": chunk['content'],
+                    "text": _preview_text(chunk['content'], preview_chars),
                     "metadata": chunk.get('metadata', {})
                 })
             
@@ -358,24 +401,28 @@ async def get_document_chunks(document_id: str):
             return DocumentChunksResponse(
                 document_id=document_id,
                 chunks=chunks,
-                total=len(chunks)
+                total=total
             )
         
         # Get chunks from Zilliz (local development)
         vector_store = get_vector_store()
-        chunks = vector_store.get_document_chunks(document_id)
+        chunks = vector_store.get_document_chunks(document_id, offset=offset, limit=limit)
+        for chunk in chunks:
+            chunk["text"] = _preview_text(chunk["text"], preview_chars)
+        if limit is None and not offset:
+            total = len(chunks)
+        else:
+            total = vector_store.count_document_chunks(document_id)
         
-        if not chunks:
+        if not total:
             # Check if document exists at all (might have 0 chunks or wrong ID)
-            all_docs = vector_store.get_all_documents()
-            doc_exists = any(d["document_id"] == document_id for d in all_docs)
-            if not doc_exists:
+            if vector_store.get_document_metadata(document_id) is None:
                 raise HTTPException(status_code=404, detail="Document not found")
         
         return DocumentChunksResponse(
             document_id=document_id,
             chunks=chunks,
-            total=len(chunks)
+            total=total
         )
         
     except HTTPException:
@@ -385,6 +432,44 @@ async def get_document_chunks(document_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/{document_id}/chunks/{chunk_id}", response_model=ChunkInfo)
+async def get_document_chunk(document_id: str, chunk_id: str):
+    """
+    Get a single chunk with its full text.
+    
+    Args:
+        document_id: Document the chunk belongs to
+        chunk_id: ID of the chunk
+        
+    Returns:
+        Chunk with text and metadata
+    """
+    try:
+        use_supabase = settings.environment == "production" or settings.use_supabase_storage
+        
+        if use_supabase and settings.supabase_url and settings.supabase_key:
+            from src.storage.supabase_client import get_supabase_storage
+            chunk = get_supabase_storage().get_chunk(document_id, chunk_id)
+            if not chunk:
+                raise HTTPException(status_code=404, detail="Chunk not found")
+            return ChunkInfo(
+                chunk_id=chunk['id'],
+                text=chunk['content'],
+                metadata=chunk.get('metadata', {})
+            )
+        
+        chunk = get_vector_store().get_chunk(chunk_id)
+        if not chunk or not chunk_id.startswith(f"{document_id}_"):
+            raise HTTPException(status_code=404, detail="Chunk not found")
+        return ChunkInfo(chunk_id=chunk["id"], text=chunk["text"], metadata=chunk["metadata"])
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting chunk: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/{document_id}/metadata", response_model=DocumentInfo)
 async def get_document_metadata(document_id: str):
     """
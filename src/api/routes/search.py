@@ -5,7 +5,7 @@ from fastapi import APIRouter, HTTPException
 
 from src.api.schemas import SearchRequest, SearchResponse, SearchResult
 from src.embedding.embedder import get_embedder
-from src.retrieval.bm25_retriever import BM25Retriever
+from src.retrieval.bm25_retriever import get_bm25_retriever
 from src.retrieval.hybrid_retriever import HybridRetriever
 from src.retrieval.vector_retriever import VectorRetriever
 from src.storage.vector_store import get_vector_store
@@ -15,25 +15,30 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/search", tags=["search"])
 
 
-def _initialize_retrievers():
-    """Initialize retrievers for search."""
+def _initialize_retrievers(search_type: str):
+    """
+    Initialize the retrievers a search type needs.
+    
+    Vector search never touches BM25, so the BM25 index (shared with chat
+    and cached until the collection changes) is only loaded for bm25 and
+    hybrid searches.
+    
+    Args:
+        search_type: "vector", "bm25" or "hybrid"
+        
+    Returns:
+        Tuple of (vector_retriever, bm25_retriever, hybrid_retriever); the
+        last two are None for vector search
+    """
     vector_store = get_vector_store()
     embedder = get_embedder()
     
     # Vector retriever
     vector_retriever = VectorRetriever(vector_store, embedder)
+    if search_type == "vector":
+        return vector_retriever, None, None
     
-    # BM25 retriever - needs to be indexed with all documents
-    bm25_retriever = BM25Retriever()
-    
-    # Get all documents from vector store for BM25 indexing
-    all_results = vector_store.get()
-    if all_results["documents"]:
-        documents = [
-            {"text": text, "metadata": metadata}
-            for text, metadata in zip(all_results["documents"], all_results["metadatas"])
-        ]
-        bm25_retriever.index_documents(documents)
+    bm25_retriever = get_bm25_retriever(vector_store)
     
     # Hybrid retriever
     from config.settings import settings
@@ -59,7 +64,7 @@ async def search_documents(request: SearchRequest):
         Search results with scores
     """
     try:
-        vector_retriever, bm25_retriever, hybrid_retriever = _initialize_retrievers()
+        vector_retriever, bm25_retriever, hybrid_retriever = _initialize_retrievers(request.search_type)
         
         # Select retriever based on search type
         if request.search_type == "vector":
@@ -0,0 +1,39 @@
+"""Aggregate routes for the Streamlit UI."""
+import asyncio
+import logging
+
+from fastapi import APIRouter, HTTPException
+
+from src.api.routes.conversations import _list_conversations
+from src.api.routes.documents import _list_documents
+from src.api.schemas import UIBootstrapResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/ui", tags=["ui"])
+
+
+@router.get("/bootstrap", response_model=UIBootstrapResponse)
+async def bootstrap(conv_limit: int = 50, conv_offset: int = 0):
+    """
+    Get the conversation list and document list in a single round-trip.
+    
+    Args:
+        conv_limit: Maximum number of conversations to return
+        conv_offset: Number of conversations to skip (for pagination)
+        
+    Returns:
+        Conversation list and document list, as returned by their own endpoints
+    """
+    try:
+        # Both lists block on storage I/O, so run each on a worker thread
+        # to overlap the two round-trips
+        conversations, documents = await asyncio.gather(
+            asyncio.to_thread(_list_conversations, conv_limit, conv_offset),
+            asyncio.to_thread(_list_documents)
+        )
+    except Exception as e:
+        logger.error(f"Error loading UI bootstrap: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return UIBootstrapResponse(conversations=conversations, documents=documents)
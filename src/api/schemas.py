@@ -146,6 +146,12 @@ class ConversationListResponse(BaseModel):
     total: int
 
 
+class UIBootstrapResponse(BaseModel):
+    """Everything the chat UI needs to render, in one response."""
+    conversations: ConversationListResponse
+    documents: DocumentListResponse
+
+
 # Document metadata schemas
 class DocumentMetadataUpdate(BaseModel):
     """Request to update document metadata."""
@@ -37,13 +37,19 @@ class MarkdownProcessor:
     # Matches: | header | header |
     #          |--------|--------|
     #          | data   | data   |
+    # Data rows are atomic and repeated possessively (Python 3.11+ re), so a
+    # long run of pipe lines is never re-split by backtracking.
     TABLE_PATTERN = re.compile(
-        r'(\|[^\n]+\|\n)'           # Header row
-        r'(\|[-:\s|]+\|\n)'         # Separator row  
-        r'((?:\|[^\n]+\|\n?)+)',    # Data rows
+        r'(\|[^\n]+\|\n)'              # Header row
+        r'(\|[-:\s|]+\|\n)'            # Separator row
+        r'((?>\|[^\n]+\|\n?)++)',      # Data rows
         re.MULTILINE
     )
     
+    # Separator row inside a matched table (whitespace excludes newlines so
+    # each match stays on a single line)
+    SEPARATOR_ROW_PATTERN = re.compile(r'^\|(?:[-:|]|[^\S\n])+\|$', re.MULTILINE)
+    
     # Pattern for HTML tables (when output_tables_as_html=True)
     HTML_TABLE_PATTERN = re.compile(
         r'<table[^>]*>.*?</table>',
@@ -64,15 +70,19 @@ class MarkdownProcessor:
         
         # Find markdown tables
         for match in self.TABLE_PATTERN.finditer(markdown):
-            table_content = match.group(0)
-            rows = table_content.strip().split('\n')
+            table_content = match.group(0).strip()
             
-            # Count rows (excluding separator) and columns
-            row_count = len([r for r in rows if not re.match(r'^\|[-:\s|]+\|$', r)])
-            col_count = len(rows[0].split('|')) - 2 if rows else 0  # -2 for empty strings at start/end
+            # Count rows (excluding separator) and columns without splitting
+            # the table into a list of lines
+            total_rows = table_content.count('\n') + 1
+            separator_rows = sum(1 for _ in self.SEPARATOR_ROW_PATTERN.finditer(table_content))
+            row_count = total_rows - separator_rows
+            first_newline = table_content.find('\n')
+            header = table_content if first_newline == -1 else table_content[:first_newline]
+            col_count = header.count('|') - 1
             
             tables.append(TableChunk(
-                content=table_content.strip(),
+                content=table_content,
                 start_position=match.start(),
                 end_position=match.end(),
                 row_count=row_count,
@@ -82,9 +92,11 @@ class MarkdownProcessor:
         # Find HTML tables
         for match in self.HTML_TABLE_PATTERN.finditer(markdown):
             table_content = match.group(0)
-            # Estimate row count from <tr> tags
-            row_count = table_content.lower().count('<tr')
-            col_count = table_content.lower().count('<th') or table_content.lower().count('<td')
+            # Estimate row count from <tr> tags (tags are ASCII, so a single
+            # lowered bytes copy is enough for all three counts)
+            table_bytes = table_content.encode('latin-1', 'ignore').lower()
+            row_count = table_bytes.count(b'<tr')
+            col_count = table_bytes.count(b'<th') or table_bytes.count(b'<td')
             
             tables.append(TableChunk(
                 content=table_content,
@@ -1,6 +1,8 @@
 """Metadata extraction service for research documents."""
+import json
 import logging
 import re
+from string import Template
 from typing import Dict, List, Optional
 
 from openai import OpenAI
@@ -8,6 +10,26 @@ from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Prompt template for LLM extraction, built once at import time
+METADATA_PROMPT = Template("""Analyze the following research document and extract metadata. Return ONLY a JSON object with these fields (use null if not found):
+
+{
+  "authors": "comma-separated list of author names",
+  "year": "publication year (4 digits)",
+  "keywords": "comma-separated keywords or key terms",
+  "abstract": "document abstract or summary",
+  "doi": "DOI identifier if present",
+  "arxiv_id": "arXiv ID if present",
+  "venue": "conference or journal name"
+}
+
+Filename: $filename
+
+Document text:
+$text
+
+JSON output:""")
+
 class MetadataExtractor:
     """Extract rich metadata from research documents using LLM and regex."""
     
@@ -47,11 +69,10 @@ class MetadataExtractor:
         except Exception as e:
             logger.warning(f"LLM metadata extraction failed: {e}")
         
-        # Apply regex-based extraction to fill gaps
+        # Apply regex-based extraction to fill gaps: empty LLM fields are
+        # dropped so the regex value (if any) wins
         regex_metadata = self._extract_with_regex(document_text)
-        for key, value in regex_metadata.items():
-            if not metadata.get(key):
-                metadata[key] = value
+        metadata = regex_metadata | {k: v for k, v in metadata.items() if v}
         
         logger.info(f"Extracted metadata for {filename}: {list(metadata.keys())}")
         return metadata
@@ -70,24 +91,7 @@ class MetadataExtractor:
         # Truncate text to ~4000 characters to stay within token limits
         truncated_text = text[:4000]
         
-        prompt = f"""Analyze the following research document and extract metadata. Return ONLY a JSON object with these fields (use null if not found):
-
-{{
-  "authors": "comma-separated list of author names",
-  "year": "publication year (4 digits)",
-  "keywords": "comma-separated keywords or key terms",
-  "abstract": "document abstract or summary",
-  "doi": "DOI identifier if present",
-  "arxiv_id": "arXiv ID if present",
-  "venue": "conference or journal name"
-}}
-
-Filename: {filename}
-
-Document text:
-{truncated_text}
-
-JSON output:"""
+        prompt = METADATA_PROMPT.substitute(filename=filename, text=truncated_text)
         
         try:
             # Use lightweight model for metadata extraction
@@ -103,12 +107,10 @@ JSON output:"""
             
             result = response.choices[0].message.content.strip()
             
-            # Try to parse JSON from response
-            import json
             # Remove markdown code blocks if present
             if result.startswith("```"):
-                result = re.sub(r'^```(?:json)?\s*', '', result)
-                result = re.sub(r'\s*```$', '', result)
+                result = result[7:] if result.startswith("```json") else result[3:]
+                result = result.removesuffix("```").strip()
             
             metadata = json.loads(result)
             
@@ -80,3 +80,51 @@ class BM25Retriever:
         
         logger.info(f"BM25 search returned {len(results)} results for query: '{query[:50]}...'")
         return results
+
+
+# Index shared by the chat and search routes, keyed on the store's write
+# generation and live chunk count
+_bm25_cache = {"retriever": None, "key": None}
+
+
+def get_bm25_retriever(vector_store) -> BM25Retriever:
+    """
+    Get a BM25 retriever over the vector store's chunks.
+    
+    The index is built once and reused until this process writes to the
+    store or the live chunk count changes (writes from other processes),
+    so requests don't each reload every chunk from the store.
+    
+    Args:
+        vector_store: Vector store to index chunks from
+        
+    Returns:
+        BM25Retriever instance (empty if the collection has no chunks)
+    """
+    from config.settings import settings
+    
+    current_count = vector_store.count()
+    cache_key = (vector_store.write_generation, current_count)
+    if _bm25_cache["retriever"] is not None and _bm25_cache["key"] == cache_key:
+        logger.debug("Using cached BM25 retriever")
+        return _bm25_cache["retriever"]
+    
+    logger.info(f"Initializing BM25 index (collection count: {current_count})")
+    bm25_retriever = BM25Retriever()
+    # Limit document fetch to reduce memory spike using settings
+    max_cache = getattr(settings, 'max_documents_cache', 5000)
+    # Results only cite filename, type and page, so skip the per-chunk
+    # copies of document metadata such as abstracts
+    all_results = vector_store.get(
+        limit=min(current_count, max_cache),
+        metadata_fields=["filename", "file_type", "page"]
+    )
+    if all_results["documents"]:
+        documents = [
+            {"text": text, "metadata": metadata}
+            for text, metadata in zip(all_results["documents"], all_results["metadatas"])
+        ]
+        bm25_retriever.index_documents(documents)
+        _bm25_cache["retriever"] = bm25_retriever
+        _bm25_cache["key"] = cache_key
+    return bm25_retriever
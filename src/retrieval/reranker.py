@@ -8,6 +8,7 @@ except ImportError:
     cohere = None
 
 from config.settings import settings
+from src.utils.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +44,7 @@ class CohereReranker:
             return
             
         try:
-            self.client = cohere.ClientV2(api_key=self.api_key)
+            self.client = cohere.ClientV2(api_key=self.api_key, httpx_client=get_http_client())
             logger.info(f"Initialized CohereReranker with model={model}")
         except Exception as e:
             logger.error(f"Failed to initialize Cohere client: {e}")
@@ -61,6 +62,10 @@ class CohereReranker:
         """
         if not self.client or not documents:
             return documents[:self.top_n]
+        
+        # Nothing to prune: skip the API call unless reordering is explicitly wanted
+        if len(documents) <= self.top_n and not settings.rerank.force_reorder:
+            return documents
             
         try:
             # Prepare documents for Cohere (list of strings)
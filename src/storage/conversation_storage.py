@@ -179,12 +179,13 @@ class ConversationStorage:
         finally:
             conn.close()
     
-    def list_conversations(self, limit: int = 50) -> List[Conversation]:
+    def list_conversations(self, limit: int = 50, offset: int = 0) -> List[Conversation]:
         """
         List all conversations (without messages for performance).
         
         Args:
             limit: Maximum number of conversations to return
+            offset: Number of most recent conversations to skip
             
         Returns:
             List of Conversation objects (without messages)
@@ -193,8 +194,8 @@ class ConversationStorage:
         try:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT * FROM conversations ORDER BY updated_at DESC LIMIT ?",
-                (limit,)
+                "SELECT * FROM conversations ORDER BY updated_at DESC LIMIT ? OFFSET ?",
+                (limit, offset)
             )
             rows = cursor.fetchall()
             
@@ -1,17 +1,20 @@
 """Supabase client for storage and database operations."""
 import os
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, BinaryIO
 from pathlib import Path
 from datetime import datetime
 import json
 
 try:
-    from supabase import create_client, Client
+    from postgrest.types import ReturnMethod
+    from supabase import create_client, Client, ClientOptions
     SUPABASE_AVAILABLE = True
 except ImportError:
     SUPABASE_AVAILABLE = False
     Client = None
 
+from src.utils.http_client import get_http_client
+
 
 class SupabaseStorage:
     """Supabase storage manager for documents and embeddings."""
@@ -32,7 +35,11 @@ class SupabaseStorage:
         if not self.url or not self.key:
             raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set")
         
-        self.client: Client = create_client(self.url, self.key)
+        self.client: Client = create_client(
+            self.url,
+            self.key,
+            options=ClientOptions(httpx_client=get_http_client())
+        )
     
     # ========== Document Operations ==========
     
@@ -52,31 +59,15 @@ class SupabaseStorage:
         Returns:
             Document record with ID and metadata
         """
-        # Upload to storage with upsert option
-        try:
-            self.client.storage.from_("documents").upload(
-                file_path,
-                file_content,
-                file_options={
-                    "content-type": self._get_content_type(file_path),
-                    "upsert": "true"  # Overwrite if exists
-                }
-            )
-        except Exception as e:
-            # If duplicate, try to remove and re-upload
-            error_str = str(e)
-            if "409" in error_str or "Duplicate" in error_str or "already exists" in error_str:
-                try:
-                    self.client.storage.from_("documents").remove([file_path])
-                    self.client.storage.from_("documents").upload(
-                        file_path,
-                        file_content,
-                        file_options={"content-type": self._get_content_type(file_path)}
-                    )
-                except Exception as retry_error:
-                    raise Exception(f"Failed to upload after retry: {retry_error}")
-            else:
-                raise
+        # Upload to storage; upsert overwrites an existing object in a single PUT
+        self.client.storage.from_("documents").upload(
+            file_path,
+            file_content,
+            file_options={
+                "content-type": self._get_content_type(file_path),
+                "upsert": "true"
+            }
+        )
         
         # Create metadata record
         doc_data = {
@@ -177,13 +168,46 @@ class SupabaseStorage:
         """
         return self.client.storage.from_("documents").download(file_path)
     
+    def download_document_to(
+        self,
+        file_path: str,
+        dst: BinaryIO,
+        chunk_size: int = 1 << 20
+    ) -> int:
+        """Stream document content from storage into a writable binary file.
+        
+        Unlike download_document, the file is never held in memory as a
+        whole: it is fetched through a short-lived signed URL and written
+        to dst in chunk_size pieces.
+        
+        Args:
+            file_path: Path of file in bucket
+            dst: Writable binary file-like object
+            chunk_size: Size of each chunk read from the response
+            
+        Returns:
+            Number of bytes written
+        """
+        signed = self.client.storage.from_("documents").create_signed_url(file_path, 60)
+        signed_url = signed.get("signedURL") or signed.get("signedUrl")
+        if not signed_url:
+            raise ValueError(f"Could not create signed URL for {file_path}")
+        
+        written = 0
+        with get_http_client().stream("GET", signed_url) as response:
+            response.raise_for_status()
+            for chunk in response.iter_bytes(chunk_size=chunk_size):
+                dst.write(chunk)
+                written += len(chunk)
+        return written
+    
     # ========== Chunk Operations ==========
     
     def save_chunks(
         self,
         document_id: str,
         chunks: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
+    ) -> int:
         """Save document chunks to database.
         
         Args:
@@ -191,7 +215,7 @@ class SupabaseStorage:
             chunks: List of chunk data with content, embedding_id, metadata
             
         Returns:
-            List of created chunk records
+            Number of chunks saved
         """
         chunk_data = [
             {
@@ -204,7 +228,10 @@ class SupabaseStorage:
             for i, chunk in enumerate(chunks)
         ]
         
-        result = self.client.table("document_chunks").insert(chunk_data).execute()
+        # Callers already hold the chunk content, so skip echoing rows back
+        self.client.table("document_chunks").insert(
+            chunk_data, returning=ReturnMethod.minimal
+        ).execute()
         
         # Update document chunk count
         self.update_document(document_id, {
@@ -212,25 +239,72 @@ class SupabaseStorage:
             "processed": True
         })
         
-        return result.data
+        return len(chunk_data)
     
-    def get_document_chunks(self, document_id: str) -> List[Dict[str, Any]]:
-        """Get all chunks for a document.
+    def get_document_chunks(
+        self,
+        document_id: str,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get chunks for a document, in chunk order.
         
         Args:
             document_id: UUID of the document
+            offset: Number of chunks to skip
+            limit: Maximum number of chunks to return (None for all)
             
         Returns:
             List of chunk records
         """
-        result = (
+        query = (
             self.client.table("document_chunks")
             .select("*")
             .eq("document_id", document_id)
             .order("chunk_index")
+        )
+        if limit is not None:
+            query = query.range(offset, offset + limit - 1)
+        elif offset:
+            query = query.offset(offset)
+        return query.execute().data
+    
+    def get_chunk(self, document_id: str, chunk_id: str) -> Optional[Dict[str, Any]]:
+        """Get a single chunk of a document.
+        
+        Args:
+            document_id: UUID of the document
+            chunk_id: UUID of the chunk
+            
+        Returns:
+            Chunk record or None
+        """
+        result = (
+            self.client.table("document_chunks")
+            .select("*")
+            .eq("id", chunk_id)
+            .eq("document_id", document_id)
+            .limit(1)
             .execute()
         )
-        return result.data
+        return result.data[0] if result.data else None
+    
+    def count_document_chunks(self, document_id: str) -> int:
+        """Count chunks for a document without fetching them.
+        
+        Args:
+            document_id: UUID of the document
+            
+        Returns:
+            Number of chunks
+        """
+        result = (
+            self.client.table("document_chunks")
+            .select("id", count="exact", head=True)
+            .eq("document_id", document_id)
+            .execute()
+        )
+        return result.count or 0
     
     # ========== Conversation Operations ==========
     
@@ -241,11 +315,11 @@ class SupabaseStorage:
             title: Optional conversation title
             
         Returns:
-            Conversation record
+            Conversation record (inserted fields plus id and created_at)
         """
         data = {"title": title} if title else {}
-        result = self.client.table("conversations").insert(data).execute()
-        return result.data[0] if result.data else {}
+        result = self.client.table("conversations").insert(data).select("id", "created_at").execute()
+        return {**data, **result.data[0]} if result.data else {}
     
     def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """Get conversation by ID.
@@ -259,11 +333,12 @@ class SupabaseStorage:
         result = self.client.table("conversations").select("*").eq("id", conversation_id).execute()
         return result.data[0] if result.data else None
     
-    def list_conversations(self, limit: int = 50) -> List[Dict[str, Any]]:
+    def list_conversations(self, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
         """List recent conversations.
         
         Args:
             limit: Maximum number to return
+            offset: Number of most recent conversations to skip
             
         Returns:
             List of conversation records
@@ -272,7 +347,7 @@ class SupabaseStorage:
             self.client.table("conversations")
             .select("*")
             .order("updated_at", desc=True)
-            .limit(limit)
+            .range(offset, offset + limit - 1)
             .execute()
         )
         return result.data
@@ -293,7 +368,7 @@ class SupabaseStorage:
             sources: Optional list of source documents
             
         Returns:
-            Message record
+            Message record (inserted fields plus id and created_at)
         """
         data = {
             "conversation_id": conversation_id,
@@ -301,8 +376,8 @@ class SupabaseStorage:
             "content": content,
             "sources": sources
         }
-        result = self.client.table("messages").insert(data).execute()
-        return result.data[0] if result.data else {}
+        result = self.client.table("messages").insert(data).select("id", "created_at").execute()
+        return {**data, **result.data[0]} if result.data else {}
     
     def get_conversation_messages(self, conversation_id: str) -> List[Dict[str, Any]]:
         """Get all messages in a conversation.
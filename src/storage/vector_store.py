@@ -28,7 +28,7 @@ def get_vector_store():
             "Please set ZILLIZ_URI and ZILLIZ_TOKEN environment variables."
         )
     
-    logger.info(f"Using Zilliz Cloud vector store (collection: {settings.zilliz_collection_name})")
+    logger.debug(f"Using Zilliz Cloud vector store (collection: {settings.zilliz_collection_name})")
     
     return get_zilliz_store(
         uri=settings.zilliz_uri,
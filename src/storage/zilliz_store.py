@@ -1,8 +1,16 @@
 """Zilliz Cloud (Milvus) vector store operations."""
+import asyncio
+import hashlib
 import logging
+import sqlite3
+import threading
+import time
 import uuid
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Union
 
+import numpy as np
 from pymilvus import (
     Collection,
     CollectionSchema,
@@ -13,10 +21,51 @@ from pymilvus import (
     utility,
 )
 
+from config.settings import settings
 from src.ingestion.chunking import Chunk
 
 logger = logging.getLogger(__name__)
 
+# Embeddings may be passed as nested lists or as a float32 matrix
+Embeddings = Union[np.ndarray, List[List[float]]]
+
+# Per-chunk metadata fields returned by get()
+CHUNK_METADATA_FIELDS = [
+    "filename", "file_type", "page", "authors", "year", "keywords",
+    "abstract", "doi", "arxiv_id", "venue"
+]
+
+# Fields returned when reading chunks back for display
+CHUNK_OUTPUT_FIELDS = [
+    "id", "text", "filename", "file_type", "page", "authors", "year", "keywords"
+]
+
+# Document-level metadata fields, identical on every chunk of a document
+DOCUMENT_FIELDS = [
+    "document_id", "filename", "file_type", "upload_timestamp", "authors",
+    "year", "keywords", "abstract", "doi", "arxiv_id", "venue"
+]
+
+# Entity field <- chunk metadata key, copied when the value is set
+ENTITY_METADATA_KEYS = (
+    ("filename", "filename"),
+    ("file_type", "file_type"),
+    ("page", "page_number"),
+    ("upload_timestamp", "upload_timestamp"),
+    ("year", "year"),
+    ("abstract", "abstract"),
+    ("doi", "doi"),
+    ("arxiv_id", "arxiv_id"),
+    ("venue", "venue"),
+)
+
+# Milvus vector field type for each storage precision
+VECTOR_TYPES = {
+    "fp32": DataType.FLOAT_VECTOR,
+    "fp16": DataType.FLOAT16_VECTOR,
+    "int8": DataType.INT8_VECTOR,
+}
+
 
 class ZillizVectorStore:
     """Zilliz Cloud vector store wrapper using Milvus SDK."""
@@ -26,7 +75,9 @@ class ZillizVectorStore:
         uri: str,
         token: str,
         collection_name: str = "documents",
-        dimension: int = 1536
+        dimension: int = 1536,
+        quantization: str = "fp32",
+        catalog_path: Optional[Path] = None
     ):
         """
         Initialize Zilliz vector store.
@@ -36,11 +87,40 @@ class ZillizVectorStore:
             token: Zilliz API token
             collection_name: Name of the collection
             dimension: Embedding vector dimension
+            quantization: Vector storage precision for new collections
+                ("fp32", "fp16" or "int8"); existing collections keep theirs
+            catalog_path: SQLite file persisting the document catalog across
+                restarts (in-memory only if not provided); each URI and
+                collection gets its own file derived from this name
         """
+        if quantization not in VECTOR_TYPES:
+            raise ValueError(f"Unsupported quantization: {quantization}")
+        
         self.uri = uri
         self.token = token
         self.collection_name = collection_name
         self.dimension = dimension
+        self.quantization = quantization
+        
+        # Document catalog: one metadata record per document, persisted to
+        # SQLite so restarts skip the collection scan, and kept up to date by
+        # local writes. Worker processes sharing the file see each other's
+        # writes through SQLite's data_version; writes that bypass the file
+        # are caught by periodically comparing the collection's row count.
+        self._cache_lock = threading.RLock()
+        self._catalog: Optional[Dict[str, Dict]] = None
+        self._catalog_version: Optional[int] = None
+        self._catalog_checked_at = 0.0
+        self._catalog_db = self._open_catalog_db(
+            self._catalog_file(catalog_path, uri, collection_name)
+        )
+        # Lowercased text searched by search_documents, per document, and
+        # an inverted index from blob token to document IDs
+        self._search_blobs: Dict[str, str] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        # Bumped by every insert or delete made through this store, so
+        # derived indexes (BM25) can tell the chunks changed
+        self.write_generation = 0
         
         # Initialize Milvus client
         self.client = MilvusClient(
@@ -53,7 +133,7 @@ class ZillizVectorStore:
         
         logger.info(
             f"Initialized ZillizVectorStore with collection '{collection_name}' "
-            f"(dimension={dimension})"
+            f"(dimension={dimension}, quantization={self.quantization})"
         )
     
     def _ensure_collection(self):
@@ -61,6 +141,7 @@ class ZillizVectorStore:
         # Check if collection exists
         if self.client.has_collection(self.collection_name):
             logger.info(f"Collection '{self.collection_name}' already exists")
+            self._detect_quantization()
             return
         
         logger.info(f"Creating collection '{self.collection_name}'...")
@@ -93,17 +174,28 @@ class ZillizVectorStore:
         
         schema.add_field(
             field_name="embedding",
-            datatype=DataType.FLOAT_VECTOR,
+            datatype=VECTOR_TYPES[self.quantization],
             dim=self.dimension
         )
         
         # Create index params for vector search
         index_params = self.client.prepare_index_params()
-        index_params.add_index(
-            field_name="embedding",
-            index_type="AUTOINDEX",  # Zilliz auto-selects best index
-            metric_type="COSINE"
-        )
+        if settings.zilliz_index_type == "HNSW":
+            index_params.add_index(
+                field_name="embedding",
+                index_type="HNSW",
+                metric_type="COSINE",
+                params={
+                    "M": settings.zilliz_hnsw_m,
+                    "efConstruction": settings.zilliz_hnsw_ef_construction
+                }
+            )
+        else:
+            index_params.add_index(
+                field_name="embedding",
+                index_type="AUTOINDEX",  # Zilliz auto-selects best index
+                metric_type="COSINE"
+            )
         
         # Create collection
         self.client.create_collection(
@@ -114,33 +206,84 @@ class ZillizVectorStore:
         
         logger.info(f"✅ Created collection '{self.collection_name}'")
     
-    def add_documents(
+    def _detect_quantization(self):
+        """Match the storage precision of an existing collection's vector field."""
+        description = self.client.describe_collection(self.collection_name)
+        for field in description.get("fields", []):
+            if field.get("name") != "embedding":
+                continue
+            for quantization, datatype in VECTOR_TYPES.items():
+                if field.get("type") == datatype:
+                    if quantization != self.quantization:
+                        logger.warning(
+                            f"⚠️ Collection '{self.collection_name}' stores {quantization} vectors; "
+                            f"ignoring configured quantization '{self.quantization}' "
+                            f"(recreate the collection to change it)"
+                        )
+                        self.quantization = quantization
+                    return
+    
+    def _quantize(self, embeddings: np.ndarray) -> np.ndarray:
+        """
+        Cast a float32 embedding matrix to the collection's storage precision.
+        
+        int8 uses symmetric per-vector scaling to [-127, 127]. The scale is
+        not stored: cosine similarity is invariant to per-vector scaling, so
+        quantized vectors can be compared directly without dequantizing.
+        
+        Args:
+            embeddings: 2-D float32 matrix
+            
+        Returns:
+            Matrix in the dtype expected by the vector field
+        """
+        if self.quantization == "fp16":
+            return embeddings.astype(np.float16)
+        if self.quantization == "int8":
+            peak = np.abs(embeddings).max(axis=1, keepdims=True)
+            scale = np.divide(127.0, peak, out=np.zeros_like(peak), where=peak > 0)
+            return np.rint(embeddings * scale).astype(np.int8)
+        return embeddings
+    
+    def _prepare_vectors(self, embeddings: Embeddings) -> Embeddings:
+        """Validate embeddings and convert them for the collection's vector field."""
+        if self.quantization == "fp32" and not isinstance(embeddings, np.ndarray):
+            return embeddings
+        return self._quantize(self._as_matrix(np.asarray(embeddings, dtype=np.float32)))
+    
+    @staticmethod
+    def _as_matrix(embeddings: np.ndarray) -> np.ndarray:
+        """Validate a 2-D embedding matrix and view it as float32 (copying only if needed)."""
+        if embeddings.ndim != 2:
+            raise ValueError(f"Embedding matrix must be 2-D, got shape {embeddings.shape}")
+        return embeddings.astype(np.float32, copy=False)
+    
+    def _build_entities(
         self,
         chunks: List[Chunk],
-        embeddings: List[List[float]],
-        document_id: Optional[str] = None
-    ) -> str:
+        embeddings: Embeddings,
+        doc_id: str
+    ) -> List[Dict]:
         """
-        Add document chunks with embeddings to the vector store.
+        Flatten chunks and embeddings into Milvus entities.
         
         Args:
             chunks: List of Chunk objects
-            embeddings: List of embedding vectors
-            document_id: Optional document ID (generated if not provided)
+            embeddings: List of embedding vectors or a 2-D float32 matrix
+                (rows are passed to Milvus as-is, without converting to lists)
+            doc_id: Document ID the chunks belong to
             
         Returns:
-            Document ID
+            List of entity dicts ready for insertion
         """
+        embeddings = self._prepare_vectors(embeddings)
         if len(chunks) != len(embeddings):
             raise ValueError("Number of chunks must match number of embeddings")
         
-        doc_id = document_id or str(uuid.uuid4())
-        
-        # Prepare data for insertion
         entities = []
         for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-            # Prepare metadata
-            metadata = chunk.metadata.dict() if hasattr(chunk.metadata, 'dict') else {}
+            # Chunk metadata is a plain dict (page metadata plus chunk info)
+            metadata = chunk.metadata if isinstance(chunk.metadata, dict) else chunk.metadata.dict()
             
             entity = {
                 "id": f"{doc_id}_{i}",
@@ -149,36 +292,449 @@ class ZillizVectorStore:
                 "embedding": embedding,
                 "chunk_id": chunk.chunk_id,
                 "token_count": chunk.token_count,
-                # Flatten metadata fields
-                "filename": metadata.get("filename"),
-                "file_type": metadata.get("file_type"),
-                "page": metadata.get("page_number"),
-                "upload_timestamp": metadata.get("upload_timestamp"),
-                "authors": str(metadata.get("authors")) if metadata.get("authors") else None,
-                "year": metadata.get("year"),
-                "keywords": str(metadata.get("keywords")) if metadata.get("keywords") else None,
-                "abstract": metadata.get("abstract"),
-                "doi": metadata.get("doi"),
-                "arxiv_id": metadata.get("arxiv_id"),
-                "venue": metadata.get("venue"),
             }
-            
-            # Remove None values
-            entity = {k: v for k, v in entity.items() if v is not None}
+            # Flatten metadata fields, skipping unset values as we go
+            for field, key in ENTITY_METADATA_KEYS:
+                value = metadata.get(key)
+                if value is not None:
+                    entity[field] = value
+            for field in ("authors", "keywords"):
+                value = metadata.get(field)
+                if value:
+                    entity[field] = str(value)
             entities.append(entity)
         
-        # Insert into collection
-        self.client.insert(
-            collection_name=self.collection_name,
-            data=entities
+        return entities
+    
+    def _insert_batch(self, batch: List[Dict], doc_id: str, start: int) -> int:
+        """
+        Insert one batch of entities, logging (not raising) on failure.
+        
+        Args:
+            batch: Entities to insert
+            doc_id: Document ID (for logging)
+            start: Index of the first entity in the batch (for logging)
+            
+        Returns:
+            Number of entities inserted (0 if the batch failed)
+        """
+        try:
+            self.client.insert(
+                collection_name=self.collection_name,
+                data=batch
+            )
+            return len(batch)
+        except Exception as e:
+            logger.error(
+                "❌ Failed to insert chunks %d-%d for document %s: %s",
+                start, start + len(batch) - 1, doc_id, e
+            )
+            return 0
+    
+    def _check_insert_result(self, inserted: int, total: int, doc_id: str):
+        """
+        Log how many chunks of a document were stored, raising unless all were.
+        
+        A partially stored document is rolled back first, so the collection
+        never holds a document with missing chunks.
+        
+        Args:
+            inserted: Number of chunks inserted
+            total: Number of chunks in the document
+            doc_id: Document ID
+            
+        Raises:
+            RuntimeError: If any batch failed to insert
+        """
+        if inserted == total:
+            logger.info("Added %d chunks for document %s", total, doc_id)
+            return
+        if inserted:
+            try:
+                self.client.delete(
+                    collection_name=self.collection_name,
+                    filter=f'document_id == "{doc_id}"'
+                )
+            except Exception as e:
+                logger.error("❌ Failed to roll back partial document %s: %s", doc_id, e)
+        raise RuntimeError(
+            f"Stored only {inserted}/{total} chunks for document {doc_id}; insert failed"
+        )
+    
+    @staticmethod
+    def _document_record(row: Dict) -> Dict:
+        """Build a document-level metadata record from a chunk entity or row."""
+        return {
+            "document_id": row.get("document_id"),
+            "filename": row.get("filename"),
+            "file_type": row.get("file_type"),
+            "upload_timestamp": row.get("upload_timestamp"),
+            "authors": row.get("authors"),
+            "year": row.get("year"),
+            "keywords": row.get("keywords"),
+            "abstract": row.get("abstract"),
+            "doi": row.get("doi"),
+            "arxiv_id": row.get("arxiv_id"),
+            "venue": row.get("venue")
+        }
+    
+    @staticmethod
+    def _search_blob(doc: Dict) -> str:
+        """Build the lowercased text that free-text document search matches against."""
+        return " ".join(
+            doc.get(field) or "" for field in ("filename", "authors", "keywords", "abstract", "venue")
+        ).lower()
+    
+    def _index_blob(self, doc_id: str, blob: str):
+        """Add a document's search blob to the inverted index."""
+        self._search_blobs[doc_id] = blob
+        for token in set(blob.split()):
+            self._postings.setdefault(token, set()).add(doc_id)
+    
+    def _unindex_blob(self, doc_id: str):
+        """Remove a document's search blob from the inverted index."""
+        blob = self._search_blobs.pop(doc_id, None)
+        if blob is None:
+            return
+        for token in set(blob.split()):
+            doc_ids = self._postings.get(token)
+            if doc_ids is not None:
+                doc_ids.discard(doc_id)
+                if not doc_ids:
+                    del self._postings[token]
+    
+    def _query_candidates(self, query_lower: str) -> Optional[Set[str]]:
+        """
+        Narrow free-text search to documents that can contain the query.
+        
+        A query that is a substring of a blob has every interior token (one
+        with whitespace on both sides) as a whole blob token, while the first
+        and last may be cut mid-word. Intersecting the posting lists of the
+        interior tokens, found by exact lookup, therefore gives a superset of
+        the true matches. Callers still verify the exact substring on the
+        candidates. Must be called under _cache_lock.
+        
+        Args:
+            query_lower: Lowercased query text
+            
+        Returns:
+            Candidate document IDs, or None if the query has no interior tokens
+        """
+        candidates: Optional[Set[str]] = None
+        for token in set(query_lower.split()[1:-1]):
+            doc_ids = self._postings.get(token, set())
+            candidates = set(doc_ids) if candidates is None else candidates & doc_ids
+            if not candidates:
+                break
+        return candidates
+    
+    @staticmethod
+    def _catalog_file(
+        catalog_path: Optional[Path], uri: str, collection_name: str
+    ) -> Optional[Path]:
+        """
+        Derive the catalog file for one Zilliz URI and collection.
+        
+        Stores pointed at different clusters or collections must not share
+        rows or the synced state, so a short hash of both goes into the name.
+        
+        Args:
+            catalog_path: Configured catalog file, or None for in-memory
+            uri: Zilliz Cloud URI endpoint
+            collection_name: Name of the collection
+            
+        Returns:
+            Namespaced catalog file, or None
+        """
+        if catalog_path is None:
+            return None
+        digest = hashlib.blake2b(
+            f"{uri}\0{collection_name}".encode(), digest_size=6
+        ).hexdigest()
+        return catalog_path.with_name(f"{catalog_path.stem}-{digest}{catalog_path.suffix}")
+    
+    @staticmethod
+    def _open_catalog_db(catalog_path: Optional[Path]) -> sqlite3.Connection:
+        """
+        Open (and create if needed) the SQLite document catalog.
+        
+        Columns other than the key are untyped so values keep the type
+        they were stored with in Zilliz.
+        
+        Args:
+            catalog_path: Database file, or None for an in-memory catalog
+            
+        Returns:
+            Connection shared by all threads (guarded by _cache_lock)
+        """
+        if catalog_path is None:
+            target = ":memory:"
+        else:
+            catalog_path.parent.mkdir(parents=True, exist_ok=True)
+            target = str(catalog_path)
+        
+        conn = sqlite3.connect(target, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS documents "
+            f"(document_id TEXT PRIMARY KEY, {', '.join(DOCUMENT_FIELDS[1:])})"
+        )
+        # row_count: collection rows the table reflects (absent until the
+        # first full scan), adjusted by local writes
+        conn.execute("CREATE TABLE IF NOT EXISTS catalog_state (key TEXT PRIMARY KEY, value)")
+        conn.commit()
+        return conn
+    
+    def _write_catalog_rows(self, docs: List[Dict]):
+        """Insert or replace document rows in the SQLite catalog (under _cache_lock)."""
+        placeholders = ", ".join("?" * len(DOCUMENT_FIELDS))
+        self._catalog_db.executemany(
+            f"INSERT OR REPLACE INTO documents ({', '.join(DOCUMENT_FIELDS)}) VALUES ({placeholders})",
+            [tuple(doc.get(field) for field in DOCUMENT_FIELDS) for doc in docs]
+        )
+        self._catalog_db.commit()
+    
+    def _adjust_catalog_row_count(self, delta: int):
+        """Keep the recorded collection row count in step with a local write (under _cache_lock)."""
+        self._catalog_db.execute(
+            "UPDATE catalog_state SET value = value + ? WHERE key = 'row_count'", (delta,)
         )
+    
+    def _catalog_put(self, doc_id: str, entities: List[Dict]):
+        """Record a newly added document in the catalog."""
+        if not entities:
+            return
+        doc = self._document_record(entities[0])
+        with self._cache_lock:
+            self.write_generation += 1
+            self._adjust_catalog_row_count(len(entities))
+            self._write_catalog_rows([doc])
+            if self._catalog is not None:
+                self._unindex_blob(doc_id)
+                self._catalog[doc_id] = doc
+                self._index_blob(doc_id, self._search_blob(doc))
+    
+    def _catalog_remove(self, doc_id: str, deleted_count: int):
+        """Drop a deleted document from the catalog."""
+        with self._cache_lock:
+            self.write_generation += 1
+            self._adjust_catalog_row_count(-deleted_count)
+            self._catalog_db.execute("DELETE FROM documents WHERE document_id = ?", (doc_id,))
+            self._catalog_db.commit()
+            if self._catalog is not None:
+                self._catalog.pop(doc_id, None)
+                self._unindex_blob(doc_id)
+    
+    def _catalog_update(self, doc_id: str, delta: Dict):
+        """Apply a metadata update to a cataloged document."""
+        delta = {k: v for k, v in delta.items() if k in DOCUMENT_FIELDS[1:]}
+        if not delta:
+            return
+        with self._cache_lock:
+            assignments = ", ".join(f"{field} = ?" for field in delta)
+            self._catalog_db.execute(
+                f"UPDATE documents SET {assignments} WHERE document_id = ?",
+                (*delta.values(), doc_id)
+            )
+            self._catalog_db.commit()
+            if self._catalog is not None and doc_id in self._catalog:
+                doc = self._catalog[doc_id] | delta
+                self._unindex_blob(doc_id)
+                self._catalog[doc_id] = doc
+                self._index_blob(doc_id, self._search_blob(doc))
+    
+    def _get_catalog(self) -> Dict[str, Dict]:
+        """
+        Get the document catalog.
+        
+        Loaded from SQLite on first use and reloaded when another process
+        has committed to the file since. The collection is scanned if the
+        SQLite catalog has never been populated (e.g. a fresh disk), or if
+        the collection's row count, checked every ``zilliz_catalog_ttl``
+        seconds, no longer matches the catalog (writes from elsewhere).
         
-        logger.info(f"Added {len(chunks)} chunks for document {doc_id}")
+        Returns:
+            Mapping of document ID to document metadata
+        """
+        with self._cache_lock:
+            db = self._catalog_db
+            row_count = db.execute(
+                "SELECT value FROM catalog_state WHERE key = 'row_count'"
+            ).fetchone()
+            
+            ttl = settings.zilliz_catalog_ttl
+            now = time.monotonic()
+            if row_count is None or (ttl and now - self._catalog_checked_at >= ttl):
+                self._catalog_checked_at = now
+                live_count = self.count()
+                if row_count is None or row_count[0] != live_count:
+                    logger.info("Document catalog is out of date, scanning collection...")
+                    db.execute("DELETE FROM documents")
+                    self._write_catalog_rows(self._scan_documents())
+                    db.execute(
+                        "INSERT OR REPLACE INTO catalog_state (key, value) VALUES ('row_count', ?)",
+                        (live_count,)
+                    )
+                    db.commit()
+                    # Our own commits do not bump data_version, so force a reload
+                    self._catalog = None
+            
+            version = db.execute("PRAGMA data_version").fetchone()[0]
+            if self._catalog is not None and version == self._catalog_version:
+                return self._catalog
+            
+            cursor = db.execute(f"SELECT {', '.join(DOCUMENT_FIELDS)} FROM documents")
+            self._catalog = {
+                row[0]: dict(zip(DOCUMENT_FIELDS, row)) for row in cursor
+            }
+            self._search_blobs = {}
+            self._postings = {}
+            for doc_id, doc in self._catalog.items():
+                self._index_blob(doc_id, self._search_blob(doc))
+            self._catalog_version = db.execute("PRAGMA data_version").fetchone()[0]
+            return self._catalog
+    
+    def add_documents(
+        self,
+        chunks: List[Chunk],
+        embeddings: Embeddings,
+        document_id: Optional[str] = None,
+        batch_size: Optional[int] = None
+    ) -> str:
+        """
+        Add document chunks with embeddings to the vector store.
+        
+        Chunks are inserted in batches so large documents do not go out as
+        a single oversized request. If any batch fails, the batches already
+        stored are rolled back and the call raises.
+        
+        Args:
+            chunks: List of Chunk objects
+            embeddings: List of embedding vectors or a 2-D float32 matrix
+            document_id: Optional document ID (generated if not provided)
+            batch_size: Chunks per insert call (defaults to settings.zilliz_insert_batch_size)
+            
+        Returns:
+            Document ID
+            
+        Raises:
+            RuntimeError: If any chunk could not be stored
+        """
+        doc_id = document_id or str(uuid.uuid4())
+        entities = self._build_entities(chunks, embeddings, doc_id)
+        
+        batch_size = batch_size or settings.zilliz_insert_batch_size
+        inserted = sum(
+            self._insert_batch(entities[start:start + batch_size], doc_id, start)
+            for start in range(0, len(entities), batch_size)
+        )
+        self._check_insert_result(inserted, len(entities), doc_id)
+        self._catalog_put(doc_id, entities)
         return doc_id
     
+    async def add_documents_async(
+        self,
+        chunks: List[Chunk],
+        embeddings: Embeddings,
+        document_id: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        max_workers: Optional[int] = None
+    ) -> str:
+        """
+        Add document chunks concurrently without blocking the event loop.
+        
+        Each batch is inserted on a worker thread, so the round trips to
+        Zilliz overlap instead of running back to back. MilvusClient is
+        backed by a thread-safe gRPC channel, so no extra locking is needed.
+        
+        Args:
+            chunks: List of Chunk objects
+            embeddings: List of embedding vectors or a 2-D float32 matrix
+            document_id: Optional document ID (generated if not provided)
+            batch_size: Chunks per insert call (defaults to settings.zilliz_insert_batch_size)
+            max_workers: Concurrent insert threads (defaults to settings.zilliz_insert_workers)
+            
+        Returns:
+            Document ID
+            
+        Raises:
+            RuntimeError: If any chunk could not be stored
+        """
+        doc_id = document_id or str(uuid.uuid4())
+        entities = self._build_entities(chunks, embeddings, doc_id)
+        
+        batch_size = batch_size or settings.zilliz_insert_batch_size
+        max_workers = max_workers or settings.zilliz_insert_workers
+        
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            counts = await asyncio.gather(*(
+                loop.run_in_executor(
+                    executor,
+                    self._insert_batch,
+                    entities[start:start + batch_size],
+                    doc_id,
+                    start
+                )
+                for start in range(0, len(entities), batch_size)
+            ))
+        # The rollback on failure is a blocking delete, so keep it off the loop too
+        await loop.run_in_executor(
+            None, self._check_insert_result, sum(counts), len(entities), doc_id
+        )
+        self._catalog_put(doc_id, entities)
+        return doc_id
+    
+    @staticmethod
+    def _build_filter(filter_dict: Optional[Dict]) -> Optional[str]:
+        """Translate an equality filter dict into a Milvus filter expression."""
+        if not filter_dict:
+            return None
+        filter_parts = []
+        for key, value in filter_dict.items():
+            if isinstance(value, str):
+                filter_parts.append(f'{key} == "{value}"')
+            else:
+                filter_parts.append(f'{key} == {value}')
+        return " && ".join(filter_parts) if filter_parts else None
+    
+    @staticmethod
+    def _format_hit(hit: Dict) -> Dict:
+        """Convert a Milvus search hit into a result with text, metadata and score."""
+        # Reconstruct metadata
+        metadata = {
+            "document_id": hit.get("document_id"),
+            "filename": hit.get("filename"),
+            "file_type": hit.get("file_type"),
+            "page": hit.get("page"),
+        }
+        
+        # Add optional metadata
+        if hit.get("authors"):
+            metadata["authors"] = hit.get("authors")
+        if hit.get("year"):
+            metadata["year"] = hit.get("year")
+        if hit.get("keywords"):
+            metadata["keywords"] = hit.get("keywords")
+        if hit.get("abstract"):
+            metadata["abstract"] = hit.get("abstract")
+        if hit.get("doi"):
+            metadata["doi"] = hit.get("doi")
+        if hit.get("arxiv_id"):
+            metadata["arxiv_id"] = hit.get("arxiv_id")
+        if hit.get("venue"):
+            metadata["venue"] = hit.get("venue")
+        
+        return {
+            "id": hit.get("id"),
+            "text": hit.get("text"),
+            "metadata": metadata,
+            "score": hit.get("distance", 0)  # Cosine similarity score
+        }
+    
     def search(
         self,
-        query_embedding: List[float],
+        query_embedding: Union[np.ndarray, List[float]],
         top_k: int = 5,
         filter_dict: Optional[Dict] = None
     ) -> List[Dict]:
@@ -186,71 +742,54 @@ class ZillizVectorStore:
         Search for similar documents using vector similarity.
         
         Args:
-            query_embedding: Query embedding vector
+            query_embedding: Query embedding vector (list or 1-D array)
             top_k: Number of results to return
             filter_dict: Optional metadata filter
             
         Returns:
             List of search results with text, metadata, and scores
         """
-        # Build filter expression if provided
-        filter_expr = None
-        if filter_dict:
-            filter_parts = []
-            for key, value in filter_dict.items():
-                if isinstance(value, str):
-                    filter_parts.append(f'{key} == "{value}"')
-                else:
-                    filter_parts.append(f'{key} == {value}')
-            filter_expr = " && ".join(filter_parts) if filter_parts else None
-        
-        # Search
+        results = self.search_batch([query_embedding], top_k=top_k, filter_dict=filter_dict)[0]
+        logger.debug("Found %d results for query", len(results))
+        return results
+    
+    def search_batch(
+        self,
+        query_embeddings: Embeddings,
+        top_k: int = 5,
+        filter_dict: Optional[Dict] = None
+    ) -> List[List[Dict]]:
+        """
+        Search for several query embeddings in a single request.
+        
+        Args:
+            query_embeddings: Query embedding vectors or a 2-D float32 matrix
+            top_k: Number of results to return per query
+            filter_dict: Optional metadata filter applied to every query
+            
+        Returns:
+            One list of search results per query, in input order
+        """
+        if len(query_embeddings) == 0:
+            return []
+        query_embeddings = self._prepare_vectors(query_embeddings)
+        
+        # HNSW needs a candidate list at least as long as the result list
+        search_params = None
+        if settings.zilliz_index_type == "HNSW":
+            search_params = {"params": {"ef": max(settings.zilliz_hnsw_ef, top_k)}}
+        
         results = self.client.search(
             collection_name=self.collection_name,
-            data=[query_embedding],
+            data=query_embeddings,
             limit=top_k,
             output_fields=["id", "document_id", "text", "filename", "file_type", "page", 
                           "authors", "year", "keywords", "abstract", "doi", "arxiv_id", "venue"],
-            filter=filter_expr
+            filter=self._build_filter(filter_dict),
+            search_params=search_params
         )
         
-        # Format results
-        formatted_results = []
-        for hits in results:
-            for hit in hits:
-                # Reconstruct metadata
-                metadata = {
-                    "document_id": hit.get("document_id"),
-                    "filename": hit.get("filename"),
-                    "file_type": hit.get("file_type"),
-                    "page": hit.get("page"),
-                }
-                
-                # Add optional metadata
-                if hit.get("authors"):
-                    metadata["authors"] = hit.get("authors")
-                if hit.get("year"):
-                    metadata["year"] = hit.get("year")
-                if hit.get("keywords"):
-                    metadata["keywords"] = hit.get("keywords")
-                if hit.get("abstract"):
-                    metadata["abstract"] = hit.get("abstract")
-                if hit.get("doi"):
-                    metadata["doi"] = hit.get("doi")
-                if hit.get("arxiv_id"):
-                    metadata["arxiv_id"] = hit.get("arxiv_id")
-                if hit.get("venue"):
-                    metadata["venue"] = hit.get("venue")
-                
-                formatted_results.append({
-                    "id": hit.get("id"),
-                    "text": hit.get("text"),
-                    "metadata": metadata,
-                    "score": hit.get("distance", 0)  # Cosine similarity score
-                })
-        
-        logger.debug(f"Found {len(formatted_results)} results for query")
-        return formatted_results
+        return [[self._format_hit(hit) for hit in hits] for hits in results]
     
     def delete_document(self, document_id: str) -> int:
         """
@@ -269,11 +808,56 @@ class ZillizVectorStore:
             collection_name=self.collection_name,
             filter=filter_expr
         )
-        
         deleted_count = result.get("delete_count", 0)
-        logger.info(f"Deleted {deleted_count} chunks for document {document_id}")
+        self._catalog_remove(document_id, deleted_count)
+        
+        logger.info("Deleted %d chunks for document %s", deleted_count, document_id)
         return deleted_count
     
+    def update_document_metadata(
+        self,
+        document_id: str,
+        metadata_update: Dict,
+        batch_size: Optional[int] = None
+    ) -> int:
+        """
+        Update metadata fields on every chunk of a document.
+        
+        Only the changed fields are sent: chunks are upserted as partial
+        updates of ``{id, **delta}``, so text and embeddings are never read
+        back or rewritten.
+        
+        Args:
+            document_id: Document ID to update
+            metadata_update: Fields to set (None values are ignored)
+            batch_size: Chunks per upsert call (defaults to the insert batch size)
+            
+        Returns:
+            Number of chunks updated (0 if the document does not exist)
+        """
+        delta = {k: v for k, v in metadata_update.items() if v is not None}
+        batch_size = batch_size or settings.zilliz_insert_batch_size
+        
+        chunk_ids = [
+            row["id"]
+            for row in self._iter_rows(["id"], filter_expr=f'document_id == "{document_id}"')
+        ]
+        if not chunk_ids or not delta:
+            return len(chunk_ids)
+        
+        for start in range(0, len(chunk_ids), batch_size):
+            self.client.upsert(
+                collection_name=self.collection_name,
+                data=[{"id": chunk_id, **delta} for chunk_id in chunk_ids[start:start + batch_size]],
+                partial_update=True
+            )
+        self._catalog_update(document_id, delta)
+        
+        logger.info(
+            "Updated %s on %d chunks for document %s", list(delta), len(chunk_ids), document_id
+        )
+        return len(chunk_ids)
+    
     def count_document_chunks(self, document_id: str) -> int:
         """
         Count chunks for a specific document.
@@ -286,119 +870,322 @@ class ZillizVectorStore:
         """
         filter_expr = f'document_id == "{document_id}"'
         
+        # Server-side count: no rows are transferred and no 10k cap applies
         results = self.client.query(
             collection_name=self.collection_name,
             filter=filter_expr,
-            output_fields=["id"],
-            limit=10000  # Max limit to count all
+            output_fields=["count(*)"]
         )
         
-        return len(results)
+        return results[0]["count(*)"] if results else 0
     
     def get_all_documents(self) -> List[Dict]:
         """
         Get list of all unique documents in the store.
         
+        Served from the document catalog, so listing is O(documents) rather
+        than a scan over every chunk.
+        
         Returns:
             List of document metadata
         """
-        # Query all documents with limit
-        results = self.client.query(
+        with self._cache_lock:
+            return list(self._get_catalog().values())
+    
+    def get_document_metadata(self, document_id: str) -> Optional[Dict]:
+        """
+        Get metadata for a single document.
+        
+        Args:
+            document_id: Document ID
+            
+        Returns:
+            Document metadata or None if the document does not exist
+        """
+        with self._cache_lock:
+            return self._get_catalog().get(document_id)
+    
+    def search_documents(
+        self,
+        query: Optional[str] = None,
+        authors: Optional[str] = None,
+        year_min: Optional[int] = None,
+        year_max: Optional[int] = None,
+        keywords: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Search documents by metadata filters and free text.
+        
+        Runs over the document catalog (one record per document) rather than
+        over chunks: a chunk-level Zilliz filter would return every chunk of
+        each matching document only to be deduplicated again. The cheap
+        metadata filters run first so the free-text match only sees the
+        narrowed set. All matches are case-insensitive partial matches.
+        
+        Args:
+            query: Text to match against filename, authors, keywords, abstract and venue
+            authors: Filter by authors (partial match)
+            year_min: Minimum publication year
+            year_max: Maximum publication year
+            keywords: Filter by keywords (partial match)
+            
+        Returns:
+            List of matching document metadata
+        """
+        query_lower = query.lower() if query else None
+        with self._cache_lock:
+            documents = list(self._get_catalog().values())
+            search_blobs = self._search_blobs
+            candidates = self._query_candidates(query_lower) if query_lower else None
+        
+        if authors:
+            authors_lower = authors.lower()
+            documents = [d for d in documents if authors_lower in (d.get("authors") or "").lower()]
+        
+        if keywords:
+            keywords_lower = keywords.lower()
+            documents = [d for d in documents if keywords_lower in (d.get("keywords") or "").lower()]
+        
+        if year_min is not None or year_max is not None:
+            filtered = []
+            for doc in documents:
+                year = self._parse_year(doc.get("year"))
+                if year is None:
+                    continue
+                if year_min is not None and year < year_min:
+                    continue
+                if year_max is not None and year > year_max:
+                    continue
+                filtered.append(doc)
+            documents = filtered
+        
+        if query_lower:
+            # Inverted-index candidates first, then the exact substring check
+            documents = [
+                d for d in documents
+                if (candidates is None or d["document_id"] in candidates)
+                and query_lower in search_blobs.get(d["document_id"], "")
+            ]
+        
+        return documents
+    
+    @staticmethod
+    def _parse_year(value) -> Optional[int]:
+        """Parse a stored year value, returning None if it is not a number."""
+        try:
+            return int(str(value).strip()[:4])
+        except (TypeError, ValueError):
+            return None
+    
+    def _iter_rows(
+        self,
+        output_fields: List[str],
+        filter_expr: str = "",
+        limit: Optional[int] = None,
+        batch_size: int = 1000
+    ) -> Iterator[Dict]:
+        """
+        Page through matching rows with a query iterator.
+        
+        Only one page is held in memory at a time, and unlike a single
+        query() call the scan is not capped at Milvus' 16384-row window.
+        
+        Args:
+            output_fields: Fields to return for each row
+            filter_expr: Optional Milvus filter expression
+            limit: Maximum number of rows to yield (None for all)
+            batch_size: Rows fetched per page
+            
+        Yields:
+            Row dicts
+        """
+        iterator = self.client.query_iterator(
             collection_name=self.collection_name,
-            filter="",
-            output_fields=["document_id", "filename", "file_type", "upload_timestamp",
-                          "authors", "year", "keywords", "abstract", "doi", "arxiv_id", "venue"],
-            limit=10000
+            batch_size=batch_size,
+            limit=limit if limit is not None else -1,
+            filter=filter_expr,
+            output_fields=output_fields
         )
+        try:
+            while True:
+                page = iterator.next()
+                if not page:
+                    break
+                yield from page
+        finally:
+            iterator.close()
+    
+    def _scan_documents(self, batch_size: int = 200) -> List[Dict]:
+        """
+        Scan the collection and collect one metadata record per document.
+        
+        Only ``document_id`` is streamed for every chunk; the metadata
+        fields are then fetched once per document from its first chunk
+        (``{document_id}_0``) by primary key.
+        
+        Args:
+            batch_size: Documents fetched per primary-key lookup
+            
+        Returns:
+            List of document metadata
+        """
+        doc_ids = list(dict.fromkeys(
+            row["document_id"]
+            for row in self._iter_rows(output_fields=["document_id"])
+            if row.get("document_id")
+        ))
         
-        # Extract unique documents
         documents = {}
-        for item in results:
-            doc_id = item.get("document_id")
-            if doc_id and doc_id not in documents:
-                documents[doc_id] = {
-                    "document_id": doc_id,
-                    "filename": item.get("filename"),
-                    "file_type": item.get("file_type"),
-                    "upload_timestamp": item.get("upload_timestamp"),
-                    "authors": item.get("authors"),
-                    "year": item.get("year"),
-                    "keywords": item.get("keywords"),
-                    "abstract": item.get("abstract"),
-                    "doi": item.get("doi"),
-                    "arxiv_id": item.get("arxiv_id"),
-                    "venue": item.get("venue")
-                }
+        for start in range(0, len(doc_ids), batch_size):
+            rows = self.client.get(
+                collection_name=self.collection_name,
+                ids=[f"{doc_id}_0" for doc_id in doc_ids[start:start + batch_size]],
+                output_fields=DOCUMENT_FIELDS
+            )
+            for row in rows:
+                documents[row["document_id"]] = self._document_record(row)
+        
+        # Documents whose first chunk failed to insert: take any chunk
+        for doc_id in doc_ids:
+            if doc_id not in documents:
+                rows = self.client.query(
+                    collection_name=self.collection_name,
+                    filter=f'document_id == "{doc_id}"',
+                    output_fields=DOCUMENT_FIELDS,
+                    limit=1
+                )
+                if rows:
+                    documents[doc_id] = self._document_record(rows[0])
         
-        return list(documents.values())
+        return [documents[doc_id] for doc_id in doc_ids if doc_id in documents]
     
-    def get_document_chunks(self, document_id: str) -> List[Dict]:
+    def get_document_chunks(
+        self,
+        document_id: str,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
         """
-        Get all chunks for a specific document.
+        Get chunks for a specific document, in chunk order.
+        
+        Chunk IDs are ``{document_id}_{index}``, so a page is fetched by
+        primary key without scanning the rest of the document.
         
         Args:
             document_id: Document ID to retrieve chunks for
+            offset: Index of the first chunk to return
+            limit: Maximum number of chunks to return (None for all)
             
         Returns:
             List of chunks with text and metadata
         """
-        filter_expr = f'document_id == "{document_id}"'
+        if limit is not None:
+            results = self.client.get(
+                collection_name=self.collection_name,
+                ids=[f"{document_id}_{i}" for i in range(offset, offset + limit)],
+                output_fields=CHUNK_OUTPUT_FIELDS
+            )
+        else:
+            filter_expr = f'document_id == "{document_id}"'
+            results = self.client.query(
+                collection_name=self.collection_name,
+                filter=filter_expr,
+                output_fields=CHUNK_OUTPUT_FIELDS,
+                limit=10000
+            )
         
-        results = self.client.query(
-            collection_name=self.collection_name,
-            filter=filter_expr,
-            output_fields=["id", "text", "filename", "file_type", "page", 
-                          "authors", "year", "keywords"],
-            limit=10000
-        )
+        # Milvus returns rows in storage order; sort by the chunk index
+        # encoded in the ID suffix ("{document_id}_{i}") with one argsort
+        if results:
+            chunk_indices = np.fromiter(
+                (int(item["id"].rsplit("_", 1)[1]) for item in results),
+                dtype=np.int64,
+                count=len(results)
+            )
+            results = [results[i] for i in np.argsort(chunk_indices, kind="stable")]
         
-        chunks = []
-        for item in results:
-            metadata = {
-                "filename": item.get("filename"),
-                "file_type": item.get("file_type"),
-                "page": item.get("page"),
-                "authors": item.get("authors"),
-                "year": item.get("year"),
-                "keywords": item.get("keywords"),
-            }
-            metadata = {k: v for k, v in metadata.items() if v is not None}
-            
-            chunks.append({
-                "id": item.get("id"),
-                "text": item.get("text"),
-                "metadata": metadata
-            })
+        if limit is None:
+            results = results[offset:]
         
-        return chunks
+        return [self._chunk_from_row(item) for item in results]
+    
+    def get_chunk(self, chunk_id: str) -> Optional[Dict]:
+        """
+        Get a single chunk by its ID.
+        
+        Args:
+            chunk_id: Chunk ID (``{document_id}_{index}``)
+            
+        Returns:
+            Chunk with text and metadata, or None if it does not exist
+        """
+        results = self.client.get(
+            collection_name=self.collection_name,
+            ids=[chunk_id],
+            output_fields=CHUNK_OUTPUT_FIELDS
+        )
+        return self._chunk_from_row(results[0]) if results else None
+    
+    @staticmethod
+    def _chunk_from_row(item: Dict) -> Dict:
+        """Shape a chunk row as {id, text, metadata}, dropping unset metadata."""
+        metadata = {
+            "filename": item.get("filename"),
+            "file_type": item.get("file_type"),
+            "page": item.get("page"),
+            "authors": item.get("authors"),
+            "year": item.get("year"),
+            "keywords": item.get("keywords"),
+        }
+        return {
+            "id": item.get("id"),
+            "text": item.get("text"),
+            "metadata": {k: v for k, v in metadata.items() if v is not None}
+        }
     
     def count(self) -> int:
         """
         Get total count of chunks in collection.
         
+        Counted server-side with count(*): the collection stats' row_count
+        still includes deleted rows until segments are compacted.
+        
         Returns:
             Total number of chunks
         """
-        stats = self.client.get_collection_stats(self.collection_name)
-        return stats.get("row_count", 0)
+        results = self.client.query(
+            collection_name=self.collection_name,
+            filter="",
+            output_fields=["count(*)"],
+            # Strong so rows this process just wrote are counted
+            consistency_level="Strong"
+        )
+        return results[0]["count(*)"] if results else 0
     
-    def get(self, limit: Optional[int] = None, **kwargs) -> Dict:
+    def get(
+        self,
+        limit: Optional[int] = None,
+        metadata_fields: Optional[List[str]] = None,
+        **kwargs
+    ) -> Dict:
         """
         Get all chunks from collection (ChromaDB-compatible API).
         
         Args:
             limit: Maximum number of chunks to return
+            metadata_fields: Metadata fields to fetch per chunk (defaults to
+                all of them); narrowing this skips per-chunk copies of large
+                document fields such as the abstract
             **kwargs: Additional query parameters (ignored for compatibility)
             
         Returns:
             Dictionary with 'documents' and 'metadatas' keys
         """
-        # Query all chunks
-        results = self.client.query(
-            collection_name=self.collection_name,
-            filter="",
-            output_fields=["id", "document_id", "text", "filename", "file_type", "page",
-                          "authors", "year", "keywords", "abstract", "doi", "arxiv_id", "venue"],
+        fields = CHUNK_METADATA_FIELDS if metadata_fields is None else metadata_fields
+        
+        # Page through all chunks
+        results = self._iter_rows(
+            output_fields=["id", "document_id", "text", *fields],
             limit=limit or 10000
         )
         
@@ -409,28 +1196,12 @@ class ZillizVectorStore:
         for item in results:
             documents.append(item.get("text", ""))
             
-            metadata = {
-                "document_id": item.get("document_id"),
-                "filename": item.get("filename"),
-                "file_type": item.get("file_type"),
-                "page": item.get("page"),
-            }
-            
-            # Add optional fields if present
-            if item.get("authors"):
-                metadata["authors"] = item.get("authors")
-            if item.get("year"):
-                metadata["year"] = item.get("year")
-            if item.get("keywords"):
-                metadata["keywords"] = item.get("keywords")
-            if item.get("abstract"):
-                metadata["abstract"] = item.get("abstract")
-            if item.get("doi"):
-                metadata["doi"] = item.get("doi")
-            if item.get("arxiv_id"):
-                metadata["arxiv_id"] = item.get("arxiv_id")
-            if item.get("venue"):
-                metadata["venue"] = item.get("venue")
+            metadata = {"document_id": item.get("document_id")}
+            for field in fields:
+                value = item.get(field)
+                # Location fields are always present; the rest only if set
+                if value or field in ("filename", "file_type", "page"):
+                    metadata[field] = value
             
             metadatas.append(metadata)
         
@@ -458,8 +1229,10 @@ class ZillizVectorStore:
         }
 
 
-# Singleton instance
+# Singleton instance (the lock keeps concurrent first calls from each
+# opening their own Milvus connection)
 _zilliz_store: Optional[ZillizVectorStore] = None
+_zilliz_store_lock = threading.Lock()
 
 
 def get_zilliz_store(
@@ -482,23 +1255,27 @@ def get_zilliz_store(
     """
     global _zilliz_store
     
-    if _zilliz_store is None:
-        from config.settings import settings
-        
-        uri = uri or settings.zilliz_uri
-        token = token or settings.zilliz_token
-        
-        if not uri or not token:
-            raise ValueError(
-                "Zilliz URI and token must be provided or set in environment variables "
-                "(ZILLIZ_URI and ZILLIZ_TOKEN)"
+    if _zilliz_store is not None:
+        return _zilliz_store
+    
+    with _zilliz_store_lock:
+        if _zilliz_store is None:
+            uri = uri or settings.zilliz_uri
+            token = token or settings.zilliz_token
+            
+            if not uri or not token:
+                raise ValueError(
+                    "Zilliz URI and token must be provided or set in environment variables "
+                    "(ZILLIZ_URI and ZILLIZ_TOKEN)"
+                )
+            
+            _zilliz_store = ZillizVectorStore(
+                uri=uri,
+                token=token,
+                collection_name=collection_name,
+                dimension=dimension,
+                quantization=settings.embedding.quantization,
+                catalog_path=settings.zilliz_catalog_path
             )
-        
-        _zilliz_store = ZillizVectorStore(
-            uri=uri,
-            token=token,
-            collection_name=collection_name,
-            dimension=dimension
-        )
     
     return _zilliz_store
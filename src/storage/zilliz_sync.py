@@ -58,24 +58,21 @@ async def sync_zilliz_from_supabase(document_id: Optional[str] = None) -> dict:
                 
                 logger.info(f"📥 Syncing {doc['filename']} (ID: {doc['id']})")
                 
-                # Download file from Supabase Storage
                 file_path = doc.get('file_path')
                 if not file_path:
                     logger.warning(f"⚠️  No file_path for document {doc['id']}, skipping")
                     skipped += 1
                     continue
                 
-                file_content = supabase_storage.download_document(file_path)
-                
-                # Save to temp location for processing
+                # Stream file from Supabase Storage into a temp location for processing
                 temp_dir = Path(settings.documents_dir) / "temp"
                 temp_dir.mkdir(exist_ok=True, parents=True)
                 temp_file = temp_dir / f"sync_{doc['id']}_{doc['filename']}"
                 
-                with open(temp_file, "wb") as f:
-                    f.write(file_content)
-                
                 try:
+                    with open(temp_file, "wb") as f:
+                        supabase_storage.download_document_to(file_path, f)
+                    
                     # Load and process document
                     pages, is_markdown = DocumentLoader.load(temp_file)
                     
@@ -98,7 +95,7 @@ async def sync_zilliz_from_supabase(document_id: Optional[str] = None) -> dict:
                     embeddings = embedder.embed_texts(texts)
                     
                     # Add to Zilliz with the original document ID
-                    vector_store.add_documents(chunks, embeddings, document_id=doc['id'])
+                    await vector_store.add_documents_async(chunks, embeddings, document_id=doc['id'])
                     
                     logger.info(f"✅ Synced {doc['filename']}: {len(chunks)} chunks")
                     synced += 1
@@ -1,4 +1,5 @@
 """Utility modules."""
+from src.utils.http_client import get_http_client
 from src.utils.memory_monitor import (
     check_memory_limit,
     format_memory_stats,
@@ -11,4 +12,5 @@ __all__ = [
     "log_memory_usage",
     "check_memory_limit",
     "format_memory_stats",
+    "get_http_client",
 ]
@@ -0,0 +1,40 @@
+"""Shared pooled HTTP client for outbound API calls."""
+import logging
+from typing import Optional
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# Singleton instance
+_http_client: Optional[httpx.Client] = None
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Get or create the process-wide pooled httpx client.
+
+    Shared by the Cohere and Supabase SDKs so keep-alive connections (and
+    HTTP/2 when h2 is installed) are reused across requests instead of
+    paying a TCP + TLS handshake per client instance.
+
+    Returns:
+        Shared httpx.Client instance
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            follow_redirects=True
+        )
+        logger.info(f"Initialized shared HTTP client (http2={HTTP2_AVAILABLE})")
+    return _http_client
@@ -3,6 +3,7 @@ Test complete Supabase integration - Upload document và xem kết quả.
 """
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Setup environment
 os.environ["USE_SUPABASE_STORAGE"] = "true"
@@ -31,7 +32,11 @@ try:
     else:
         print(f"   Total: {len(docs)} documents\n")
         
-        for i, doc in enumerate(docs, 1):
+        # Fetch every document's chunks concurrently (one round-trip each)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            all_chunks = list(executor.map(storage.get_document_chunks, [d['id'] for d in docs]))
+        
+        for i, (doc, chunks) in enumerate(zip(docs, all_chunks), 1):
             print(f"   {i}. {doc['filename']}")
             print(f"      📊 Size: {doc['file_size']:,} bytes")
             print(f"      📅 Uploaded: {doc['upload_date']}")
@@ -39,8 +44,6 @@ try:
             print(f"      📦 Chunks: {doc['chunk_count']}")
             print(f"      🆔 ID: {doc['id']}")
             
-            # Get chunks for this document
-            chunks = storage.get_document_chunks(doc['id'])
             if chunks:
                 print(f"      📝 Chunk details:")
                 for chunk in chunks[:3]:  # Show first 3 chunks
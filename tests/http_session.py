@@ -0,0 +1,24 @@
+"""Shared HTTP session for the live API test scripts."""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def make_session() -> requests.Session:
+    """
+    Create a keep-alive session whose retries ride out cold starts.
+    
+    urllib3 does not retry POSTs by default, so uploads are not retried.
+    
+    Returns:
+        requests.Session with a small retrying connection pool
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -1,15 +1,24 @@
-import requests
 import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.http_session import make_session
 
 BASE_URL = "https://rag-native.onrender.com"
 
+# One keep-alive session for every call
+session = make_session()
+
 def test_health():
     """Test health endpoint"""
     print("=" * 60)
     print("1. Testing Health Check")
     print("=" * 60)
     try:
-        response = requests.get(f"{BASE_URL}/health", timeout=10)
+        response = session.get(f"{BASE_URL}/health", timeout=10)
         print(f"Status: {response.status_code}")
         print(f"Response: {json.dumps(response.json(), indent=2)}")
         return response.status_code == 200
@@ -23,7 +32,7 @@ def test_root():
     print("2. Testing Root Endpoint")
     print("=" * 60)
     try:
-        response = requests.get(f"{BASE_URL}/", timeout=10)
+        response = session.get(f"{BASE_URL}/", timeout=10)
         print(f"Status: {response.status_code}")
         print(f"Response: {json.dumps(response.json(), indent=2)}")
         return response.status_code == 200
@@ -37,7 +46,7 @@ def test_documents_list():
     print("3. Testing Documents List")
     print("=" * 60)
     try:
-        response = requests.get(f"{BASE_URL}/documents", timeout=10)
+        response = session.get(f"{BASE_URL}/documents", timeout=10)
         print(f"Status: {response.status_code}")
         print(f"Response: {json.dumps(response.json(), indent=2)}")
         return response.status_code == 200
@@ -51,7 +60,7 @@ def test_conversations_list():
     print("4. Testing Conversations List")
     print("=" * 60)
     try:
-        response = requests.get(f"{BASE_URL}/conversations", timeout=10)
+        response = session.get(f"{BASE_URL}/conversations", timeout=10)
         print(f"Status: {response.status_code}")
         print(f"Response: {json.dumps(response.json(), indent=2)}")
         return response.status_code == 200
@@ -69,7 +78,7 @@ def test_search():
             "query": "test query",
             "top_k": 3
         }
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/search",
             json=payload,
             timeout=10
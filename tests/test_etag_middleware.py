@@ -0,0 +1,82 @@
+"""Tests for the ETag middleware."""
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from src.api.middleware import ETagMiddleware
+
+
+def make_client():
+    """App with one tagged route, one untagged route and one failing route."""
+    app = FastAPI()
+    state = {"version": 1}
+
+    @app.get("/documents")
+    def documents():
+        return {"version": state["version"]}
+
+    @app.get("/documents/missing")
+    def missing():
+        return JSONResponse({"detail": "not found"}, status_code=404)
+
+    @app.get("/other")
+    def other():
+        return {"ok": True}
+
+    app.add_middleware(ETagMiddleware, path_prefixes=["/documents"])
+    return TestClient(app), state
+
+
+def test_etag_added_under_prefix():
+    """GET responses under the prefix carry a weak ETag and revalidation headers."""
+    client, _ = make_client()
+    response = client.get("/documents")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"].startswith('W/"')
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert response.json() == {"version": 1}
+
+
+def test_matching_if_none_match_returns_304():
+    """An unchanged body answers a conditional request with an empty 304."""
+    client, _ = make_client()
+    etag = client.get("/documents").headers["ETag"]
+
+    response = client.get("/documents", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert "content-length" not in response.headers or response.headers["content-length"] == "0"
+
+
+def test_etag_list_in_if_none_match():
+    """Any ETag in a comma-separated If-None-Match list counts as a match."""
+    client, _ = make_client()
+    etag = client.get("/documents").headers["ETag"]
+
+    response = client.get("/documents", headers={"If-None-Match": f'W/"stale", {etag}'})
+
+    assert response.status_code == 304
+
+
+def test_changed_body_returns_200_with_new_etag():
+    """Once the body changes, the old ETag no longer matches."""
+    client, state = make_client()
+    etag = client.get("/documents").headers["ETag"]
+    state["version"] = 2
+
+    response = client.get("/documents", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json() == {"version": 2}
+    assert response.headers["ETag"] != etag
+
+
+def test_errors_and_other_paths_untagged():
+    """Non-200 responses and paths outside the prefix pass through unchanged."""
+    client, _ = make_client()
+
+    assert "ETag" not in client.get("/documents/missing").headers
+    assert "ETag" not in client.get("/other").headers
@@ -0,0 +1,67 @@
+"""Tests for markdown table extraction."""
+from src.ingestion.markdown_processor import MarkdownProcessor
+
+
+TABLE = (
+    "| Model | Params | Score |\n"
+    "|-------|:------:|------:|\n"
+    "| BERT  | 110M   | 80.5  |\n"
+    "| GPT-2 | 1.5B   | 85.1  |\n"
+)
+
+
+def test_table_rows_and_columns_counted():
+    """The separator row is excluded from the row count; columns come from the header."""
+    tables = MarkdownProcessor().extract_tables(f"Intro text.\n\n{TABLE}\nClosing text.\n")
+
+    assert len(tables) == 1
+    assert tables[0].row_count == 3
+    assert tables[0].column_count == 3
+    assert tables[0].content == TABLE.strip()
+
+
+def test_table_without_trailing_newline():
+    """A table at the very end of the document is still counted correctly."""
+    tables = MarkdownProcessor().extract_tables("| a |\n|---|\n| 1 |")
+
+    assert len(tables) == 1
+    assert tables[0].row_count == 2
+    assert tables[0].column_count == 1
+
+
+def test_separator_with_spaces_not_counted_as_row():
+    """Separator rows padded with spaces are recognised as separators."""
+    table = "| a | b |\n| --- | --- |\n| 1 | 2 |\n"
+    tables = MarkdownProcessor().extract_tables(table)
+
+    assert tables[0].row_count == 2
+    assert tables[0].column_count == 2
+
+
+
+def test_table_pattern_groups():
+    """Header, separator and data rows land in their own groups."""
+    match = MarkdownProcessor.TABLE_PATTERN.search(TABLE)
+
+    assert match.group(1) == "| Model | Params | Score |\n"
+    assert match.group(2) == "|-------|:------:|------:|\n"
+    assert match.group(3).count("\n") == 2
+
+
+def test_table_pattern_keeps_tables_apart():
+    """A blank line ends a table, so adjacent tables are matched separately."""
+    markdown = "| a |\n|---|\n| 1 |\n| 2 |\n\n| b |\n|---|\n| 3 |\n"
+    tables = MarkdownProcessor().extract_tables(markdown)
+
+    assert [t.content for t in tables] == ["| a |\n|---|\n| 1 |\n| 2 |", "| b |\n|---|\n| 3 |"]
+
+
+def test_table_pattern_on_long_malformed_input():
+    """Long runs of pipe lines with a broken tail or no separator match (or not) without backtracking."""
+    broken_tail = "| a | b |\n|---|---|\n" + "| x | y |\n" * 5000 + "| broken"
+    no_separator = "| x | y |\n" * 5000 + "plain text"
+
+    matches = MarkdownProcessor.TABLE_PATTERN.findall(broken_tail)
+    assert len(matches) == 1
+    assert matches[0][2].count("\n") == 5000
+    assert MarkdownProcessor.TABLE_PATTERN.search(no_separator) is None
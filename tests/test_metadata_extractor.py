@@ -0,0 +1,50 @@
+"""Tests for merging LLM and regex metadata."""
+from src.ingestion.metadata_extractor import MetadataExtractor
+
+TEXT = "Attention Is All You Need. arXiv:1706.03762v5 doi:10.48550/arXiv.1706.03762"
+
+
+def make_extractor(llm_metadata=None, llm_error=None):
+    """Build an extractor whose LLM step returns (or raises) a canned result."""
+    extractor = MetadataExtractor.__new__(MetadataExtractor)
+
+    def fake_llm(text, filename):
+        if llm_error:
+            raise llm_error
+        return llm_metadata
+
+    extractor._extract_with_llm = fake_llm
+    return extractor
+
+
+def test_llm_fields_override_regex():
+    """Non-empty LLM values win over the regex values for the same key."""
+    metadata = make_extractor({"arxiv_id": "1706.03762", "authors": "Vaswani"}).extract(TEXT, "a.pdf")
+
+    assert metadata["arxiv_id"] == "1706.03762"
+    assert metadata["authors"] == "Vaswani"
+    assert metadata["doi"] == "10.48550/arXiv.1706.03762"
+
+
+def test_empty_llm_fields_fall_back_to_regex():
+    """A null or empty LLM value does not hide the regex value."""
+    metadata = make_extractor({"doi": None, "arxiv_id": ""}).extract(TEXT, "a.pdf")
+
+    assert metadata["doi"] == "10.48550/arXiv.1706.03762"
+    assert metadata["arxiv_id"] == "1706.03762v5"
+
+
+def test_empty_llm_fields_without_fallback_are_dropped():
+    """Null LLM fields with no regex value are left out rather than stored as None."""
+    metadata = make_extractor({"venue": None, "keywords": "", "authors": "Vaswani"}).extract(TEXT, "a.pdf")
+
+    assert "venue" not in metadata
+    assert "keywords" not in metadata
+    assert None not in metadata.values()
+
+
+def test_llm_failure_keeps_regex_metadata():
+    """If the LLM call fails, the regex metadata is still returned."""
+    metadata = make_extractor(llm_error=RuntimeError("rate limited")).extract(TEXT, "a.pdf")
+
+    assert metadata == {"doi": "10.48550/arXiv.1706.03762", "arxiv_id": "1706.03762v5"}
@@ -0,0 +1,42 @@
+"""Tests for server-side chunk preview truncation."""
+from src.api.routes.documents import _preview_text
+
+
+def test_no_limit_returns_text_unchanged():
+    """Without preview_chars the full text comes back untouched."""
+    text = "line one\n\nline two"
+
+    assert _preview_text(text, None) is text
+    assert _preview_text(None, 10) is None
+
+
+def test_short_text_collapsed_to_one_line():
+    """Text within the limit is kept whole, with whitespace runs collapsed."""
+    assert _preview_text("hello  world\n\nfoo", 100) == "hello world foo"
+
+
+def test_truncates_on_word_boundary():
+    """A cut word is dropped instead of being shown half-way."""
+    assert _preview_text("hello world foo", 8) == "hello..."
+    assert _preview_text("hello world foo", 13) == "hello world..."
+
+
+def test_keeps_word_ending_exactly_at_limit():
+    """A word that ends exactly at the limit is not treated as cut."""
+    assert _preview_text("hello world foo", 11) == "hello world..."
+    assert _preview_text("hello world foo", 5) == "hello..."
+
+
+def test_single_long_word_is_hard_cut():
+    """A single word longer than the limit is cut at the limit."""
+    assert _preview_text("supercalifragilistic", 5) == "super..."
+
+
+def test_preview_never_exceeds_limit():
+    """The preview body (before the ellipsis) stays within preview_chars."""
+    text = "Attention   is all\nyou need " * 20
+    for limit in range(1, 60):
+        preview = _preview_text(text, limit)
+        assert preview.endswith("...")
+        assert len(preview) - 3 <= limit
+        assert "\n" not in preview and "  " not in preview
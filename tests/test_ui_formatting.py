@@ -0,0 +1,37 @@
+"""Tests for the Streamlit pages' LaTeX formatting."""
+import sys
+from pathlib import Path
+
+# The pages import their helpers as the top-level "lib" package under ui/
+sys.path.insert(0, str(Path(__file__).parent.parent / "ui"))
+
+from lib import formatting
+from lib.formatting import format_latex
+
+
+def test_plain_text_returned_as_is(monkeypatch):
+    """Text without \\[ or \\( skips the regex passes entirely."""
+    class FailingPattern:
+        def sub(self, *args, **kwargs):
+            raise AssertionError("regex pass ran on plain text")
+
+    monkeypatch.setattr(formatting, "LATEX_BLOCK_PATTERN", FailingPattern())
+    monkeypatch.setattr(formatting, "LATEX_INLINE_PATTERN", FailingPattern())
+    text = "Plain prose with [brackets], $dollars$ and a backslash \\ but no delimiters."
+
+    assert format_latex(text) is text
+    assert format_latex("") == ""
+    assert format_latex(None) is None
+
+
+def test_block_and_inline_delimiters_rewritten():
+    """\\[ ... \\] becomes $$ ... $$ and \\( ... \\) becomes $ ... $."""
+    text = "Energy \\( E = mc^2 \\) and\n\\[\n\\sum_i x_i\n\\]"
+
+    assert format_latex(text) == "Energy $ E = mc^2 $ and\n$$\n\\sum_i x_i\n$$"
+
+
+def test_only_one_delimiter_kind_present():
+    """The fast path does not skip text that has just one kind of delimiter."""
+    assert format_latex("a \\[x\\] b") == "a $$x$$ b"
+    assert format_latex("a \\(x\\) b") == "a $x$ b"
@@ -1,16 +1,25 @@
 """Upload test document to verify Supabase integration."""
-import requests
 import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.http_session import make_session
 
 API_URL = "http://localhost:8000"
 
+# One keep-alive session for every call
+session = make_session()
+
 print("🚀 Testing document upload to Supabase...\n")
 
 # Upload document
 print("📤 Uploading test_document.txt...")
 with open("test_document.txt", "rb") as f:
     files = {"file": ("test_document.txt", f, "text/plain")}
-    response = requests.post(f"{API_URL}/documents/upload", files=files)
+    response = session.post(f"{API_URL}/documents/upload", files=files)
 
 if response.status_code == 200:
     data = response.json()
@@ -25,7 +34,7 @@ else:
 
 # List documents
 print("\n📋 Listing all documents...")
-response = requests.get(f"{API_URL}/documents")
+response = session.get(f"{API_URL}/documents")
 if response.status_code == 200:
     data = response.json()
     print(f"✅ Found {data['total']} documents:")
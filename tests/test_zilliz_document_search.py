@@ -0,0 +1,68 @@
+"""Tests for the inverted index behind Zilliz free-text document search."""
+import random
+
+from src.storage.zilliz_store import ZillizVectorStore
+
+
+def make_store(blobs):
+    """Build a store with only the search index populated (no Zilliz client)."""
+    store = ZillizVectorStore.__new__(ZillizVectorStore)
+    store._search_blobs = {}
+    store._postings = {}
+    for doc_id, blob in blobs.items():
+        store._index_blob(doc_id, blob)
+    return store
+
+
+def matches(store, query):
+    """Documents kept by the candidate filter plus the exact substring check."""
+    candidates = store._query_candidates(query)
+    doc_ids = store._search_blobs if candidates is None else candidates
+    return {doc_id for doc_id in doc_ids if query in store._search_blobs[doc_id]}
+
+
+def test_short_queries_do_not_narrow():
+    """One- and two-word queries may be cut mid-word, so every document stays a candidate."""
+    store = make_store({"a": "attention is all you need", "b": "graph neural networks"})
+
+    assert store._query_candidates("atten") is None
+    assert store._query_candidates("is al") is None
+
+
+def test_interior_tokens_use_exact_lookup():
+    """Interior query tokens must be whole blob tokens."""
+    store = make_store({
+        "a": "attention is all you need",
+        "b": "this island is big",
+        "c": "graph neural networks"
+    })
+
+    assert store._query_candidates("all you need") == {"a"}
+    assert store._query_candidates("attention is all") == {"a", "b"}
+    assert store._query_candidates("his island is") == {"b"}
+    assert store._query_candidates("x missing y") == set()
+
+
+def test_unindex_removes_postings():
+    """Removing a document drops it from every posting list."""
+    store = make_store({"a": "attention is all you need", "b": "all you need is love"})
+    store._unindex_blob("a")
+
+    assert store._query_candidates("x all you y") == {"b"}
+    assert "attention" not in store._postings
+
+
+def test_candidates_agree_with_substring_scan():
+    """Narrowing never changes the results of a plain substring scan."""
+    words = "attention is all you need transformer neural graph bert deep learning".split()
+    rng = random.Random(0)
+    store = make_store({
+        str(i): " ".join(rng.choice(words) for _ in range(20)) for i in range(200)
+    })
+
+    for _ in range(500):
+        blob = store._search_blobs[str(rng.randrange(200))]
+        start = rng.randrange(len(blob))
+        query = blob[start:start + rng.randrange(1, 40)]
+        expected = {doc_id for doc_id, text in store._search_blobs.items() if query in text}
+        assert matches(store, query) == expected
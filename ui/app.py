@@ -1,8 +1,12 @@
 """Streamlit frontend for RAG Native."""
 import os
-import requests
 import streamlit as st
 import re
+import time
+from collections import OrderedDict, defaultdict, deque
+from functools import wraps
+from pathlib import Path
+from lib import get_session, json_loads
 
 # API Configuration
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
@@ -15,6 +19,17 @@ else:
 
 BACKEND_API_URL = os.getenv("BACKEND_API_URL", DEFAULT_BACKEND_URL)
 
+# Conversations shown in the collapsed sidebar, and per page when expanded
+CONV_PREVIEW_SIZE = 3
+CONV_PAGE_SIZE = 20
+
+# (connect, read) timeouts; chat waits on retrieval + LLM generation
+REQUEST_TIMEOUT = (3, 30)
+CHAT_TIMEOUT = (3, 120)
+
+# Conversations whose last ETag and payload are kept for conditional re-fetches
+ETAG_STORE_SIZE = 256
+
 # Page config
 st.set_page_config(
     page_title="RAG Native - Research Assistant",
@@ -23,53 +38,33 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Show toast if document was recently uploaded
-if "upload_success" in st.session_state:
-    st.toast(f"✅ Uploaded: {st.session_state.upload_success}", icon='📄')
-    del st.session_state.upload_success
-
-# Custom CSS
-st.markdown("""
-<style>
-    .main-title {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #1E88E5;
-        margin-bottom: 0.5rem;
-    }
-    .subtitle {
-        font-size: 1.2rem;
-        color: #666;
-        margin-bottom: 2rem;
-    }
-    .source-box {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 0.5rem 0;
-    }
-    .chunk-preview {
-        background-color: #fafafa;
-        padding: 0.8rem;
-        border-left: 3px solid #1E88E5;
-        margin: 0.5rem 0;
-        font-size: 0.9rem;
-    }
-    .conversation-item {
-        padding: 0.5rem;
-        border-radius: 0.3rem;
-        margin: 0.2rem 0;
-        cursor: pointer;
-    }
-    .conversation-item:hover {
-        background-color: #f0f2f6;
-    }
-    .conversation-active {
-        background-color: #e3f2fd;
-        border-left: 3px solid #1E88E5;
-    }
-</style>
-""", unsafe_allow_html=True)
+
+@st.cache_resource
+def _css() -> str:
+    """Custom CSS from app.css, read and wrapped once per process."""
+    css = (Path(__file__).parent / "app.css").read_text(encoding="utf-8")
+    return f"<style>\n{css}</style>"
+
+
+# Custom CSS (re-emitted every run: Streamlit drops elements a rerun skips)
+st.markdown(_css(), unsafe_allow_html=True)
+
+
+# LaTeX delimiters rewritten by format_latex
+LATEX_BLOCK_PATTERN = re.compile(r'\\\[(.*?)\\\]', re.DOTALL)
+LATEX_INLINE_PATTERN = re.compile(r'\\\((.*?)\\\)', re.DOTALL)
+# [ ... ] that are not part of source citations [Source: ...]
+BRACKET_PATTERN = re.compile(r'(?<!\[Source: )\[\s*(.*?)\s*\]')
+# Characters that mark bracket content as math (a backslash covers \sum, \frac, ...)
+MATH_INDICATOR_SEARCH = re.compile(r'[\\_^=+*/{}]').search
+
+
+def _replace_brackets(match):
+    """Turn a raw [ ... ] block into $$ ... $$ if it looks like math."""
+    content = match.group(1)
+    if MATH_INDICATOR_SEARCH(content):
+        return f"$$\n{content.strip()}\n$$"
+    return match.group(0)
 
 
 def format_latex(text: str) -> str:
@@ -77,31 +72,44 @@ def format_latex(text: str) -> str:
     Ensures LaTeX formulas are correctly formatted for Streamlit.
     Replaces \\[ ... \\] with $$ ... $$ and \\( ... \\) with $ ... $
     """
-    if not text:
+    # Plain answers (no brackets, no inline delimiters) need no regex work
+    if not text or ('[' not in text and '\\(' not in text):
         return text
     
     # Replace \[ ... \] with $$ ... $$ for block formulas
-    text = re.sub(r'\\\[(.*?)\\\]', r'$$\1$$', text, flags=re.DOTALL)
+    if '\\[' in text:
+        text = LATEX_BLOCK_PATTERN.sub(r'$$\1$$', text)
     
     # Replace \( ... \) with $ ... $ for inline formulas
-    text = re.sub(r'\\\((.*?)\\\)', r'$\1$', text, flags=re.DOTALL)
+    if '\\(' in text:
+        text = LATEX_INLINE_PATTERN.sub(r'$\1$', text)
     
     # Handle potential raw [ ... ] math blocks if they contain math symbols
-    # This specifically addresses the user's example style
-    def replace_brackets(match):
-        content = match.group(1)
-        # Use more specific math indicators to avoid false positives
-        math_indicators = ['\\', '_', '^', '=', '+', '*', '/', '{', '}', '\sum', '\int', '\frac', '\sqrt', '\alpha', '\beta', '\gamma']
-        if any(indicator in content for indicator in math_indicators):
-            return f"$$\n{content.strip()}\n$$"
-        return match.group(0)
-    
-    # Match [ ... ] that are not part of source citations [Source: ...]
-    text = re.sub(r'(?<!\[Source: )\[\s*(.*?)\s*\]', replace_brackets, text)
+    if '[' in text:
+        text = BRACKET_PATTERN.sub(_replace_brackets, text)
     
     return text
 
 
+# Traffic-light marker per 25-point confidence band (100 gets its own band)
+_CONF_COLORS = ("🔴", "🔴", "🟡", "🟢", "🟢")
+
+
+def _conf_color(conf_score: float) -> str:
+    """Traffic-light marker for a citation confidence score."""
+    return _CONF_COLORS[min(max(int(conf_score) // 25, 0), 4)]
+
+
+def format_sources(sources) -> str:
+    """Format a message's source citations as one markdown block."""
+    return "\n\n".join(
+        f"**[{source.get('citation_index', '?')}]** {source['filename']}, page {source['page']} "
+        f"({source['file_type'].upper()}) {_conf_color(source.get('confidence_score', 0))} "
+        f"**{source.get('confidence_score', 0):.1f}%**"
+        for source in sources
+    )
+
+
 def init_session_state():
     """Initialize session state variables."""
     if "messages" not in st.session_state:
@@ -114,54 +122,123 @@ def init_session_state():
         st.session_state.model_mode = "light"
     if "current_conversation_id" not in st.session_state:
         st.session_state.current_conversation_id = None
-    if "conversations" not in st.session_state:
-        st.session_state.conversations = []
     if "show_all_conversations" not in st.session_state:
         st.session_state.show_all_conversations = False
-    if "uploader_key" not in st.session_state:
-        st.session_state.uploader_key = 0
-
-
-# API functions for conversations
-def get_conversations(limit: int = 50):
-    """Get list of all conversations."""
+    if "conv_page" not in st.session_state:
+        st.session_state.conv_page = 0
+
+
+@st.cache_resource
+def _latencies() -> dict:
+    """Recent wall times (seconds) per API helper, shared process-wide."""
+    return defaultdict(lambda: deque(maxlen=1000))
+
+
+def timed(fn):
+    """Record each call's wall time, cache hits included, under the function's name."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _latencies()[fn.__name__].append(time.perf_counter() - start)
+    return wrapper
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _fetch_bootstrap(conv_limit: int, conv_offset: int):
+    # Raises on failure so errors are never cached
+    response = get_session().get(
+        f"{BACKEND_API_URL}/ui/bootstrap",
+        params={"conv_limit": conv_limit, "conv_offset": conv_offset},
+        timeout=REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    return json_loads(response.content)
+
+
+@timed
+def get_bootstrap(conv_limit: int = CONV_PREVIEW_SIZE, conv_offset: int = 0):
+    """Get a page of conversations and the document list in one backend call."""
     try:
-        response = requests.get(f"{BACKEND_API_URL}/conversations?limit={limit}")
-        response.raise_for_status()
-        return response.json()
+        return _fetch_bootstrap(conv_limit, conv_offset)
     except Exception as e:
-        st.error(f"Error fetching conversations: {e}")
-        return {"conversations": [], "total": 0}
+        st.error(f"Error loading conversations and documents: {e}")
+        return {
+            "conversations": {"conversations": [], "total": 0},
+            "documents": {"documents": [], "total": 0}
+        }
 
 
+# API functions for conversations
+@timed
 def create_conversation(title: str = None):
     """Create a new conversation."""
     try:
         data = {"title": title} if title else {}
-        response = requests.post(f"{BACKEND_API_URL}/conversations", json=data)
+        response = get_session().post(f"{BACKEND_API_URL}/conversations", json=data, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        return response.json()
+        _fetch_bootstrap.clear()
+        return json_loads(response.content)
     except Exception as e:
         st.error(f"Error creating conversation: {e}")
         return None
 
 
+@st.cache_resource
+def _conversation_etags() -> OrderedDict:
+    """Last (ETag, payload) seen per conversation, least recently used first."""
+    return OrderedDict()
+
+
+@st.cache_data(ttl=300, max_entries=64, show_spinner=False)
+def _fetch_conversation(conversation_id: str):
+    # Raises on failure so errors are never cached. Once the TTL lapses the
+    # re-fetch is conditional, and an unchanged conversation costs a 304.
+    etags = _conversation_etags()
+    known = etags.get(conversation_id)
+    headers = {"If-None-Match": known[0]} if known else {}
+    response = get_session().get(
+        f"{BACKEND_API_URL}/conversations/{conversation_id}",
+        headers=headers,
+        timeout=REQUEST_TIMEOUT
+    )
+    if response.status_code == 304 and known:
+        entry = known
+    else:
+        response.raise_for_status()
+        conversation = json_loads(response.content)
+        if "ETag" not in response.headers:
+            return conversation
+        entry = (response.headers["ETag"], conversation)
+    # Pop and re-insert (each atomic) to mark the entry most recently used
+    etags.pop(conversation_id, None)
+    etags[conversation_id] = entry
+    while len(etags) > ETAG_STORE_SIZE:
+        etags.popitem(last=False)
+    return entry[1]
+
+
+@timed
 def get_conversation(conversation_id: str):
     """Get a conversation with its messages."""
     try:
-        response = requests.get(f"{BACKEND_API_URL}/conversations/{conversation_id}")
-        response.raise_for_status()
-        return response.json()
+        return _fetch_conversation(conversation_id)
     except Exception as e:
         st.error(f"Error fetching conversation: {e}")
         return None
 
 
+@timed
 def delete_conversation(conversation_id: str):
     """Delete a conversation."""
     try:
-        response = requests.delete(f"{BACKEND_API_URL}/conversations/{conversation_id}")
+        response = get_session().delete(f"{BACKEND_API_URL}/conversations/{conversation_id}", timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
+        _fetch_bootstrap.clear()
+        _fetch_conversation.clear(conversation_id)
+        _conversation_etags().pop(conversation_id, None)
         return True
     except Exception as e:
         st.error(f"Error deleting conversation: {e}")
@@ -172,35 +249,65 @@ def delete_conversation(conversation_id: str):
 
 
 
-def get_documents():
-    """Get list of all documents."""
+def chat(query, top_k, search_type, model_mode, conversation_id=None, result=None):
+    """
+    Ask a question using RAG, yielding the answer as it streams in.
+    
+    Sources arrive after the last token and are stored in ``result["sources"]``.
+    """
+    data = {
+        "query": query,
+        "top_k": top_k,
+        "search_type": search_type,
+        "model_mode": model_mode
+    }
+    if conversation_id:
+        data["conversation_id"] = conversation_id
+    
     try:
-        response = requests.get(f"{BACKEND_API_URL}/documents")
-        response.raise_for_status()
-        return response.json()
+        with get_session().post(
+            f"{BACKEND_API_URL}/chat/stream",
+            json=data,
+            stream=True,
+            timeout=CHAT_TIMEOUT,
+            headers={"Accept": "text/event-stream", "Cache-Control": "no-cache"}
+        ) as response:
+            response.raise_for_status()
+            # Raw byte lines: the JSON parser decodes UTF-8 itself
+            for line in response.iter_lines():
+                if not line.startswith(b"data:"):
+                    continue
+                event = json_loads(line[5:])
+                if "token" in event:
+                    yield event["token"]
+                elif "error" in event:
+                    raise RuntimeError(event["error"])
+                elif event.get("done"):
+                    if result is not None:
+                        result["sources"] = event.get("sources", [])
+                    if conversation_id:
+                        # Chat updates the conversation's title, recency and messages
+                        _fetch_bootstrap.clear()
+                        _fetch_conversation.clear(conversation_id)
     except Exception as e:
-        st.error(f"Error fetching documents: {e}")
-        return {"documents": [], "total": 0}
+        st.error(f"Error in chat: {e}")
 
 
-def chat(query, top_k, search_type, model_mode, conversation_id=None):
-    """Ask a question using RAG."""
-    try:
-        data = {
-            "query": query,
-            "top_k": top_k,
-            "search_type": search_type,
-            "model_mode": model_mode
-        }
-        if conversation_id:
-            data["conversation_id"] = conversation_id
-            
-        response = requests.post(f"{BACKEND_API_URL}/chat", json=data)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        st.error(f"Error in chat: {e}")
-        return None
+def make_message(role: str, content: str, sources=None) -> dict:
+    """
+    Build a history entry with its markdown pre-rendered.
+    
+    The chat history is redrawn on every rerun, so LaTeX fix-ups and the
+    sources block are formatted once here rather than per message per run.
+    """
+    sources = sources or []
+    return {
+        "role": role,
+        "content": content,
+        "sources": sources,
+        "rendered_content": format_latex(content),
+        "rendered_sources": format_sources(sources) if sources else ""
+    }
 
 
 def load_conversation_messages(conversation_id: str):
@@ -208,20 +315,44 @@ def load_conversation_messages(conversation_id: str):
     conv = get_conversation(conversation_id)
     if conv and conv.get("messages"):
         st.session_state.messages = [
-            {
-                "role": msg["role"],
-                "content": msg["content"],
-                "sources": msg.get("sources", [])
-            }
+            make_message(msg["role"], msg["content"], msg.get("sources"))
             for msg in conv["messages"]
         ]
     else:
         st.session_state.messages = []
 
 
+# Sidebar button callbacks. Streamlit runs on_click callbacks before the
+# script, so main() fetches with the new state and no second run is needed.
+def _set_state(**values):
+    """Assign session state values."""
+    for key, value in values.items():
+        st.session_state[key] = value
+
+
+def _new_conversation():
+    """Create a conversation and make it the active one."""
+    conv = create_conversation()
+    if conv:
+        st.session_state.current_conversation_id = conv["id"]
+        st.session_state.messages = []
+
+
+def _open_conversation(conversation_id: str):
+    """Make a conversation active and load its messages."""
+    st.session_state.current_conversation_id = conversation_id
+    load_conversation_messages(conversation_id)
+
 
+def _delete_conversation(conversation_id: str):
+    """Delete a conversation, clearing the chat if it was the active one."""
+    if delete_conversation(conversation_id):
+        if st.session_state.current_conversation_id == conversation_id:
+            st.session_state.current_conversation_id = None
+            st.session_state.messages = []
 
-def render_sidebar():
+
+def render_sidebar(convs):
     """Render sidebar with document management and conversations."""
     with st.sidebar:
         st.markdown("## 💬 Conversations")
@@ -229,68 +360,95 @@ def render_sidebar():
         # New conversation button
         col1, col2 = st.columns([3, 1])
         with col1:
-            if st.button("➕ New Conversation", use_container_width=True):
-                conv = create_conversation()
-                if conv:
-                    st.session_state.current_conversation_id = conv["id"]
-                    st.session_state.messages = []
-                    st.rerun()
+            st.button("➕ New Conversation", use_container_width=True, on_click=_new_conversation)
         
         # Refresh conversations
         with col2:
-            if st.button("🔄", help="Refresh conversations"):
-                st.rerun()
+            st.button("🔄", help="Refresh conversations", on_click=_fetch_bootstrap.clear)
         
-        # List conversations
-        # Fetch 50 by default, or 1000 if showing all
-        limit = 1000 if st.session_state.show_all_conversations else 50
-        convs = get_conversations(limit=limit)
+        # List conversations (convs holds only the page being shown)
         if convs["total"] > 0:
-            all_convs = convs["conversations"]
-            display_convs = all_convs if st.session_state.show_all_conversations else all_convs[:3]
+            expanded = st.session_state.show_all_conversations
+            page = st.session_state.conv_page
             
-            for conv in display_convs:
-                is_active = st.session_state.current_conversation_id == conv["id"]
-                
+            # Page emptied by deletes: step back to the last non-empty one
+            if expanded and page > 0 and not convs["conversations"]:
+                st.session_state.conv_page = (convs["total"] - 1) // CONV_PAGE_SIZE
+                st.rerun()
+            
+            # (id, truncated title, is active) per button, built in one pass
+            active_id = st.session_state.current_conversation_id
+            rows = [
+                (
+                    conv["id"],
+                    conv["title"][:20] + "..." if len(conv["title"]) > 20 else conv["title"],
+                    conv["id"] == active_id
+                )
+                for conv in convs["conversations"]
+            ]
+            
+            for conv_id, display_title, is_active in rows:
                 col1, col2 = st.columns([4, 1])
                 with col1:
-                    # Truncate long titles
-                    display_title = conv["title"][:20] + "..." if len(conv["title"]) > 20 else conv["title"]
-                    
-                    if st.button(
-                        f"{display_title}",
-                        key=f"conv_{conv['id']}",
+                    st.button(
+                        display_title,
+                        key=f"conv_{conv_id}",
                         use_container_width=True,
-                        type="primary" if is_active else "secondary"
-                    ):
-                        st.session_state.current_conversation_id = conv["id"]
-                        load_conversation_messages(conv["id"])
-                        st.rerun()
+                        type="primary" if is_active else "secondary",
+                        on_click=_open_conversation,
+                        args=(conv_id,)
+                    )
                 
                 with col2:
-                    if st.button("🗑️", key=f"del_{conv['id']}", help="Delete conversation"):
-                        if delete_conversation(conv["id"]):
-                            if st.session_state.current_conversation_id == conv["id"]:
-                                st.session_state.current_conversation_id = None
-                                st.session_state.messages = []
-                            st.rerun()
+                    st.button(
+                        "🗑️",
+                        key=f"del_{conv_id}",
+                        help="Delete conversation",
+                        on_click=_delete_conversation,
+                        args=(conv_id,)
+                    )
             
             # Load more button
-            if not st.session_state.show_all_conversations and convs["total"] > 3:
-                if st.button("🔽 Load More", use_container_width=True):
-                    st.session_state.show_all_conversations = True
-                    st.rerun()
-            elif st.session_state.show_all_conversations and convs["total"] > 3:
-                if st.button("🔼 Show Less", use_container_width=True):
-                    st.session_state.show_all_conversations = False
-                    st.rerun()
+            if not expanded and convs["total"] > CONV_PREVIEW_SIZE:
+                st.button(
+                    "🔽 Load More",
+                    use_container_width=True,
+                    on_click=_set_state,
+                    kwargs={"show_all_conversations": True, "conv_page": 0}
+                )
+            elif expanded and convs["total"] > CONV_PREVIEW_SIZE:
+                page_count = -(-convs["total"] // CONV_PAGE_SIZE)
+                if page_count > 1:
+                    col1, col2, col3 = st.columns([1, 2, 1])
+                    with col1:
+                        st.button(
+                            "◀",
+                            disabled=page == 0,
+                            help="Newer conversations",
+                            on_click=_set_state,
+                            kwargs={"conv_page": page - 1}
+                        )
+                    with col2:
+                        st.caption(f"Page {page + 1} of {page_count}")
+                    with col3:
+                        st.button(
+                            "▶",
+                            disabled=page >= page_count - 1,
+                            help="Older conversations",
+                            on_click=_set_state,
+                            kwargs={"conv_page": page + 1}
+                        )
+                st.button(
+                    "🔼 Show Less",
+                    use_container_width=True,
+                    on_click=_set_state,
+                    kwargs={"show_all_conversations": False}
+                )
         else:
             st.info("No conversations yet. Start a new one!")
         
         st.markdown("---")
         
-        st.markdown("---")
-        
         # Settings
         st.markdown("### ⚙️ Settings")
         
@@ -309,10 +467,41 @@ def render_sidebar():
             horizontal=True,
             help="Light: faster responses | Full: more comprehensive analysis"
         )
+        
+        if st.query_params.get("debug") == "1":
+            render_debug_stats()
+
+
+def render_debug_stats():
+    """Show per-helper call latency percentiles (enabled with ?debug=1)."""
+    rows = []
+    for name, samples in sorted(_latencies().items()):
+        ordered = sorted(samples)
+        if not ordered:
+            continue
+        rows.append({
+            "call": name,
+            "count": len(ordered),
+            **{
+                f"p{q} (ms)": round(ordered[int(q / 100 * (len(ordered) - 1))] * 1000, 1)
+                for q in (50, 95, 99)
+            }
+        })
+    with st.expander("🛠️ Debug: API latency"):
+        if rows:
+            st.table(rows)
+        else:
+            st.caption("No calls recorded yet.")
 
 
-def render_main():
-    """Render main chat interface."""
+@st.fragment
+def render_main(docs):
+    """
+    Render main chat interface.
+    
+    Runs as a fragment: submitting a message reruns only the chat pane,
+    not main(), so the sidebar's bootstrap fetch is skipped on every turn.
+    """
     st.markdown('<p class="main-title">🔬 Research Assistant</p>', unsafe_allow_html=True)
     st.markdown('<p class="subtitle">Ask questions about your research documents</p>', unsafe_allow_html=True)
     
@@ -323,7 +512,6 @@ def render_main():
         st.info("💡 Start a new conversation from the sidebar to enable context memory and follow-up questions.")
     
     # Check if documents exist
-    docs = get_documents()
     if docs["total"] == 0:
         st.warning("👈 Please upload documents in the sidebar to get started")
         
@@ -340,85 +528,63 @@ def render_main():
     # Display chat messages
     for message in st.session_state.messages:
         with st.chat_message(message["role"]):
-            st.markdown(format_latex(message["content"]))
+            st.markdown(message["rendered_content"])
             
             # Display sources if available
-            if message.get("sources"):
+            if message["rendered_sources"]:
                 with st.expander("📖 Sources"):
-                    for source in message["sources"]:
-                        # Determine confidence color
-                        conf_score = source.get('confidence_score', 0)
-                        if conf_score >= 75:
-                            conf_color = "🟢"
-                        elif conf_score >= 50:
-                            conf_color = "🟡"
-                        else:
-                            conf_color = "🔴"
-                        
-                        st.markdown(
-                            f"**[{source.get('citation_index', '?')}]** {source['filename']}, page {source['page']} "
-                            f"({source['file_type'].upper()}) {conf_color} **{conf_score:.1f}%**"
-                        )
+                    st.markdown(message["rendered_sources"])
     
     # Chat input
     if prompt := st.chat_input("Ask a question about your documents..."):
         # Add user message to display
-        st.session_state.messages.append({"role": "user", "content": prompt})
+        st.session_state.messages.append(make_message("user", prompt))
         
         with st.chat_message("user"):
             st.markdown(prompt)
         
-        # Generate response
+        # Stream the response, then re-render it with LaTeX fixed up
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                response = chat(
-                    query=prompt,
-                    top_k=st.session_state.top_k,
-                    search_type=st.session_state.search_type,
-                    model_mode=st.session_state.model_mode,
-                    conversation_id=st.session_state.current_conversation_id
-                )
+            result = {}
+            placeholder = st.empty()
+            answer = placeholder.write_stream(chat(
+                query=prompt,
+                top_k=st.session_state.top_k,
+                search_type=st.session_state.search_type,
+                model_mode=st.session_state.model_mode,
+                conversation_id=st.session_state.current_conversation_id,
+                result=result
+            ))
+            
+            if answer and "sources" in result:
+                message = make_message("assistant", answer, result["sources"])
+                placeholder.markdown(message["rendered_content"])
+                
+                # Show sources
+                if message["rendered_sources"]:
+                    with st.expander("📖 Sources"):
+                        st.markdown(message["rendered_sources"])
+                
+                # Add to message history
+                st.session_state.messages.append(message)
                 
-                if response:
-                    st.markdown(format_latex(response["answer"]))
-                    
-                    # Show sources
-                    if response.get("sources"):
-                        with st.expander("📖 Sources"):
-                            for source in response["sources"]:
-                                # Determine confidence color
-                                conf_score = source.get('confidence_score', 0)
-                                if conf_score >= 75:
-                                    conf_color = "🟢"
-                                elif conf_score >= 50:
-                                    conf_color = "🟡"
-                                else:
-                                    conf_color = "🔴"
-                                
-                                st.markdown(
-                                    f"**[{source.get('citation_index', '?')}]** {source['filename']}, page {source['page']} "
-                                    f"({source['file_type'].upper()}) {conf_color} **{conf_score:.1f}%**"
-                                )
-                    
-                    # Add to message history
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": response["answer"],
-                        "sources": response.get("sources", [])
-                    })
-                    
-                    # Rerun to update sidebar title if it's the first message
-                    if len(st.session_state.messages) <= 2:
-                        st.rerun()
-                else:
-                    st.error("Failed to generate response")
+                # Rerun to update sidebar title if it's the first message
+                if len(st.session_state.messages) <= 2:
+                    st.rerun()
+            else:
+                st.error("Failed to generate response")
 
 
 def main():
     """Main application."""
     init_session_state()
-    render_sidebar()
-    render_main()
+    # Fetch only the conversations shown: the preview, or the current page
+    if st.session_state.show_all_conversations:
+        data = get_bootstrap(CONV_PAGE_SIZE, st.session_state.conv_page * CONV_PAGE_SIZE)
+    else:
+        data = get_bootstrap(CONV_PREVIEW_SIZE)
+    render_sidebar(data["conversations"])
+    render_main(data["documents"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,16 @@
+"""Helpers shared by the Streamlit pages."""
+from lib.api import BACKEND_API_URL, get_executor, get_session, json_loads
+from lib.formatting import doc_labels, format_latex, keyword_badges, keyword_chips
+from lib.styles import load_css
+
+__all__ = [
+    "BACKEND_API_URL",
+    "get_executor",
+    "get_session",
+    "json_loads",
+    "doc_labels",
+    "format_latex",
+    "keyword_badges",
+    "keyword_chips",
+    "load_css",
+]
@@ -0,0 +1,55 @@
+"""Backend API access shared by the Streamlit pages."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson parses API responses several times faster; fall back to the stdlib
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# API Configuration
+BACKEND_API_URL = os.getenv("BACKEND_API_URL", "http://localhost:8000")
+
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    """
+    Get the keep-alive session shared by every page.
+
+    Cached per process, so reruns, pages and browser sessions all draw from
+    one connection pool. Idempotent requests are retried on gateway errors.
+
+    Returns:
+        Shared requests.Session instance
+    """
+    session = requests.Session()
+    # Every browser session's script thread draws from this one pool, so
+    # size it for concurrent users rather than a single script run
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Get the worker pool shared by every page.
+
+    Used to run fetches in the background, either to warm a cache or to
+    overlap independent requests within one script run.
+
+    Returns:
+        Shared ThreadPoolExecutor instance
+    """
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="ui-fetch")
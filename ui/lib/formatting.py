@@ -0,0 +1,73 @@
+"""
+Text formatting shared by the Streamlit pages.
+
+Page scripts re-execute in a fresh namespace on every rerun, so memoized
+helpers live here, where the module (and its caches) persists.
+"""
+import re
+from functools import lru_cache
+from html import escape
+
+# LaTeX delimiters rewritten by format_latex
+LATEX_BLOCK_PATTERN = re.compile(r'\\\[(.*?)\\\]', re.DOTALL)
+LATEX_INLINE_PATTERN = re.compile(r'\\\((.*?)\\\)', re.DOTALL)
+
+
+def format_latex(text: str) -> str:
+    """
+    Rewrite LaTeX delimiters into the form Streamlit markdown renders.
+
+    Replaces \\[ ... \\] with $$ ... $$ and \\( ... \\) with $ ... $.
+
+    Args:
+        text: Text that may contain LaTeX
+
+    Returns:
+        Text with Streamlit-compatible math delimiters
+    """
+    # Most chunks are plain prose; a substring scan is far cheaper than a regex pass
+    if not text or ('\\[' not in text and '\\(' not in text):
+        return text
+    return LATEX_INLINE_PATTERN.sub(r'$\1$', LATEX_BLOCK_PATTERN.sub(r'$$\1$$', text))
+
+
+@lru_cache(maxsize=64)
+def doc_labels(doc_keys: tuple) -> tuple:
+    """
+    Build the document selector labels.
+
+    Args:
+        doc_keys: (document_id, filename) pairs
+
+    Returns:
+        One "filename (id prefix)" label per document
+    """
+    return tuple(f"{filename} ({doc_id[:8]})" for doc_id, filename in doc_keys)
+
+
+@lru_cache(maxsize=256)
+def keyword_badges(keywords: str) -> str:
+    """
+    Render a comma-separated keyword string as escaped metadata badges.
+
+    Args:
+        keywords: Comma-separated keywords
+
+    Returns:
+        HTML with one badge per keyword
+    """
+    return "".join(f'<span class="metadata-badge">{escape(k.strip())}</span>' for k in keywords.split(','))
+
+
+@lru_cache(maxsize=2048)
+def keyword_chips(keywords: str) -> str:
+    """
+    Render a comma-separated keyword string as escaped search-result chips.
+
+    Args:
+        keywords: Comma-separated keywords
+
+    Returns:
+        HTML with one chip per non-empty keyword
+    """
+    return " ".join(f'<span class="keyword-chip">{escape(k.strip())}</span>' for k in keywords.split(',') if k.strip())
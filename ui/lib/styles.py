@@ -0,0 +1,25 @@
+"""Page stylesheets shared by the Streamlit pages."""
+from pathlib import Path
+
+import streamlit as st
+
+# Stylesheets live next to app.py
+CSS_DIR = Path(__file__).resolve().parent.parent
+
+
+@st.cache_resource
+def load_css(filename: str) -> str:
+    """
+    Read a stylesheet and wrap it in a <style> tag, once per process.
+
+    Whitespace runs are collapsed since they only add bytes to the element
+    that is re-sent on every run.
+
+    Args:
+        filename: Stylesheet file name, relative to the ui directory
+
+    Returns:
+        HTML <style> element for st.markdown(..., unsafe_allow_html=True)
+    """
+    css = (CSS_DIR / filename).read_text(encoding="utf-8")
+    return f"<style>{' '.join(css.split())}</style>"
@@ -1,14 +1,26 @@
-import os
 import streamlit as st
-import requests
-import re
+from html import escape
 import fitz  # PyMuPDF
-import io
 from PIL import Image
 from datetime import datetime
+from lib import (
+    BACKEND_API_URL, doc_labels, format_latex, get_executor, get_session, json_loads,
+    keyword_badges, load_css
+)
+
+# (connect, read) timeouts; uploads wait on parsing, chunking and embedding
+REQUEST_TIMEOUT = (3, 30)
+UPLOAD_TIMEOUT = (3, 300)
 
-# API Configuration
-BACKEND_API_URL = os.getenv("BACKEND_API_URL", "http://localhost:8000")
+# Chunks shown per page of the chunk grid
+CHUNK_PAGE_SIZE = 12
+CHUNK_PREVIEW_CHARS = 400
+# Responses remembered for conditional GETs before the store is reset
+ETAG_STORE_SIZE = 256
+# Upload preview: pages shown, and rasterization scale (thumbnails sit in
+# narrow columns, so half of 72 DPI is enough)
+PREVIEW_PAGES = 3
+PREVIEW_SCALE = 0.5
 
 # Page config
 st.set_page_config(
@@ -17,152 +29,146 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS for the "Zoom" effect, grid, and metadata cards
-st.markdown("""
-<style>
-    .chunk-card {
-        border: 1px solid #e0e0e0;
-        border-radius: 8px;
-        padding: 15px;
-        height: 200px;
-        overflow: hidden;
-        position: relative;
-        background-color: white;
-        transition: transform 0.2s, box-shadow 0.2s;
-        cursor: pointer;
-    }
-    .chunk-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-        border-color: #1E88E5;
-    }
-    .chunk-header {
-        font-weight: bold;
-        font-size: 0.8rem;
-        color: #666;
-        margin-bottom: 8px;
-        display: flex;
-        justify-content: space-between;
-    }
-    .chunk-content {
-        font-size: 0.9rem;
-        line-height: 1.4;
-        color: #333;
-        display: -webkit-box;
-        -webkit-line-clamp: 6;
-        -webkit-box-orient: vertical;
-        overflow: hidden;
-    }
-    .metadata-badge {
-        display: inline-block;
-        background-color: #E3F2FD;
-        color: #1976D2;
-        padding: 4px 12px;
-        border-radius: 12px;
-        font-size: 0.85rem;
-        margin: 4px;
-        font-weight: 500;
-    }
-    .metadata-section {
-        background: #f8f9fa;
-        padding: 15px;
-        border-radius: 8px;
-        margin-bottom: 15px;
-    }
-    .metadata-label {
-        font-weight: 600;
-        color: #666;
-        font-size: 0.85rem;
-        margin-bottom: 4px;
-    }
-    .metadata-value {
-        color: #333;
-        margin-bottom: 10px;
-    }
-    .upload-container {
-        background-color: #f1f8ff;
-        padding: 20px;
-        border-radius: 10px;
-        border: 1px dashed #1E88E5;
-        margin-bottom: 30px;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-def format_latex(text: str) -> str:
-    if not text:
-        return text
-    text = re.sub(r'\\\[(.*?)\\\]', r'$$\1$$', text, flags=re.DOTALL)
-    text = re.sub(r'\\\((.*?)\\\)', r'$\1$', text, flags=re.DOTALL)
-    return text
+# Custom CSS for the "Zoom" effect, grid, and metadata cards (re-emitted every
+# run: Streamlit drops elements a rerun skips)
+st.markdown(load_css("library.css"), unsafe_allow_html=True)
+
+@st.cache_resource
+def _etag_store() -> dict:
+    """Last (ETag, payload) per request, for conditional re-fetches."""
+    return {}
+
+def _get_json(path, **params):
+    # Revalidates with If-None-Match, so an unchanged resource costs a 304
+    store = _etag_store()
+    key = (path, tuple(sorted(params.items())))
+    known = store.get(key)
+    headers = {"If-None-Match": known[0]} if known else {}
+    response = get_session().get(
+        f"{BACKEND_API_URL}{path}", params=params, headers=headers, timeout=REQUEST_TIMEOUT
+    )
+    if response.status_code == 304 and known:
+        return known[1]
+    response.raise_for_status()
+    payload = json_loads(response.content)
+    if "ETag" in response.headers:
+        if len(store) >= ETAG_STORE_SIZE:
+            store.clear()
+        store[key] = (response.headers["ETag"], payload)
+    return payload
+
+# Cached fetchers raise on failure so errors are never cached
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_documents():
+    return _get_json("/documents")
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_document_chunks(doc_id, page):
+    # Card previews only; the detail dialog fetches the chunk's full text
+    return _get_json(
+        f"/documents/{doc_id}/chunks",
+        offset=page * CHUNK_PAGE_SIZE, limit=CHUNK_PAGE_SIZE, preview_chars=CHUNK_PREVIEW_CHARS
+    )
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_chunk(doc_id, chunk_id):
+    return _get_json(f"/documents/{doc_id}/chunks/{chunk_id}")
+
+def clear_cache():
+    _fetch_documents.clear()
+    _fetch_document_chunks.clear()
+    _fetch_chunk.clear()
 
 def get_documents():
     try:
-        response = requests.get(f"{BACKEND_API_URL}/documents")
-        response.raise_for_status()
-        return response.json()
+        return _fetch_documents()
     except Exception as e:
         st.error(f"Error fetching documents: {e}")
         return {"documents": [], "total": 0}
 
-def get_document_chunks(doc_id):
+def get_document_chunks(doc_id, page=0):
     try:
-        response = requests.get(f"{BACKEND_API_URL}/documents/{doc_id}/chunks")
-        response.raise_for_status()
-        return response.json()
+        return _fetch_document_chunks(doc_id, page)
     except Exception as e:
         st.error(f"Error fetching chunks: {e}")
         return None
 
+def get_chunk(doc_id, chunk_id):
+    try:
+        return _fetch_chunk(doc_id, chunk_id)
+    except Exception as e:
+        st.error(f"Error fetching chunk: {e}")
+        return None
+
 def upload_document(file):
-    files = {"file": (file.name, file.getvalue(), file.type)}
+    # UploadedFile is file-like; hand it over instead of a getvalue() copy.
+    # Rewind first in case the preview or an earlier attempt read from it
+    file.seek(0)
+    files = {"file": (file.name, file, file.type)}
     try:
-        response = requests.post(f"{BACKEND_API_URL}/documents/upload", files=files)
+        response = get_session().post(f"{BACKEND_API_URL}/documents/upload", files=files, timeout=UPLOAD_TIMEOUT)
         response.raise_for_status()
-        return response.json()
+        clear_cache()
+        return json_loads(response.content)
     except Exception as e:
         st.error(f"Error uploading document: {e}")
         return None
 
 def update_document_metadata(doc_id, metadata):
     try:
-        response = requests.put(
+        response = get_session().put(
             f"{BACKEND_API_URL}/documents/{doc_id}/metadata",
-            json=metadata
+            json=metadata,
+            timeout=REQUEST_TIMEOUT
         )
         response.raise_for_status()
-        return response.json()
+        clear_cache()
+        return json_loads(response.content)
     except Exception as e:
         st.error(f"Error updating metadata: {e}")
         return None
 
 def delete_document(doc_id):
     try:
-        response = requests.delete(f"{BACKEND_API_URL}/documents/{doc_id}")
+        response = get_session().delete(f"{BACKEND_API_URL}/documents/{doc_id}", timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        return response.json()
+        clear_cache()
+        return json_loads(response.content)
     except Exception as e:
         st.error(f"Error deleting document: {e}")
         return None
 
-def get_pdf_preview(file_bytes, max_pages=5):
+PREVIEW_MATRIX = fitz.Matrix(PREVIEW_SCALE, PREVIEW_SCALE)
+
+def _rasterize_page(doc, index):
+    # Raw RGB samples go straight into PIL, skipping a PNG encode/decode
+    pix = doc.load_page(index).get_pixmap(matrix=PREVIEW_MATRIX, alpha=False)
+    return Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+
+@st.cache_data(ttl=600, max_entries=24, show_spinner=False)
+def _render_pdf_page(file_id, index, _file_bytes):
+    # Keyed on the uploader's file id so the PDF bytes aren't rehashed per page;
+    # returns None past the last page
+    with fitz.open(stream=_file_bytes, filetype="pdf") as doc:
+        return _rasterize_page(doc, index) if index < len(doc) else None
+
+def get_pdf_preview(uploaded_file, max_pages=PREVIEW_PAGES):
+    # Yields pages one at a time so each is shown as soon as it is rasterized.
+    # Serial on purpose: PyMuPDF is not thread-safe, even across documents
     try:
-        doc = fitz.open(stream=file_bytes, filetype="pdf")
-        images = []
-        num_pages = min(len(doc), max_pages)
-        for i in range(num_pages):
-            page = doc.load_page(i)
-            pix = page.get_pixmap(matrix=fitz.Matrix(1, 1))
-            img_data = pix.tobytes("png")
-            images.append(Image.open(io.BytesIO(img_data)))
-        doc.close()
-        return images
+        file_bytes = uploaded_file.getvalue()
+        for i in range(max_pages):
+            img = _render_pdf_page(uploaded_file.file_id, i, file_bytes)
+            if img is None:
+                return
+            yield i, img
     except Exception as e:
         st.error(f"Error generating PDF preview: {e}")
-        return []
 
 @st.dialog("Chunk Detail", width="large")
-def show_chunk_detail(chunk):
+def show_chunk_detail(doc_id, chunk):
+    # Grid chunks carry preview text only; fall back to it if the fetch fails
+    chunk = get_chunk(doc_id, chunk['chunk_id']) or chunk
     st.markdown(f"### Chunk ID: `{chunk['chunk_id']}`")
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -184,7 +190,7 @@ def show_metadata_editor(doc):
         col1, col2 = st.columns(2)
         with col1:
             authors = st.text_input("Authors (comma-separated)", value=doc.get('authors') or "")
-            year = st.text_input("Year", value=doc.get('year') or "")
+            year = st.text_input("Year", value=str(doc.get('year') or ""))
             doi = st.text_input("DOI", value=doc.get('doi') or "")
             arxiv_id = st.text_input("arXiv ID", value=doc.get('arxiv_id') or "")
         with col2:
@@ -197,15 +203,21 @@ def show_metadata_editor(doc):
         with col_cancel:
             cancel = st.form_submit_button("Cancel", use_container_width=True)
         if submitted:
-            updates = {
+            values = {
                 "authors": authors, "year": year, "doi": doi,
                 "arxiv_id": arxiv_id, "venue": venue,
                 "keywords": keywords, "abstract": abstract
             }
-            result = update_document_metadata(doc['document_id'], updates)
-            if result:
-                st.success("Metadata updated successfully!")
-                st.rerun()
+            # The backend only touches fields present in the request, so send just the
+            # edits; stored values may be non-strings (Zilliz returns year as an int)
+            updates = {k: v for k, v in values.items() if v != str(doc.get(k) or "")}
+            if not updates:
+                st.info("No changes to save.")
+            else:
+                result = update_document_metadata(doc['document_id'], updates)
+                if result:
+                    st.success("Metadata updated successfully!")
+                    st.rerun()
         if cancel:
             st.rerun()
 
@@ -224,6 +236,14 @@ def show_delete_confirmation(doc):
         if st.button("Cancel", use_container_width=True):
             st.rerun()
 
+def zoom_chunk():
+    # Clear the selection so the same chunk can be zoomed again later
+    st.session_state.zoomed_chunk = st.session_state.chunk_zoom
+    st.session_state.chunk_zoom = None
+
+def set_chunks_page(page):
+    st.session_state.chunks_page = page
+
 def display_metadata(doc):
     st.markdown('<div class="metadata-section">', unsafe_allow_html=True)
     if doc.get('authors'):
@@ -237,17 +257,69 @@ def display_metadata(doc):
         if doc.get('venue'): st.markdown(f"**Venue:** {doc['venue']}")
     if doc.get('keywords'):
         st.markdown("**Keywords:**")
-        keywords = [k.strip() for k in doc['keywords'].split(',')]
-        keyword_html = "".join([f'<span class="metadata-badge">{k}</span>' for k in keywords])
-        st.markdown(keyword_html, unsafe_allow_html=True)
+        st.markdown(keyword_badges(doc['keywords']), unsafe_allow_html=True)
     if doc.get('abstract'):
         with st.expander("📄 Abstract"):
             st.markdown(doc['abstract'])
     st.markdown('</div>', unsafe_allow_html=True)
 
+# Zooming and paging rerun only this fragment, not the upload and management sections
+@st.fragment
+def render_chunks(doc_id):
+    with st.spinner("Loading chunks..."):
+        page = st.session_state.chunks_page
+        chunks_data = get_document_chunks(doc_id, page)
+
+    if chunks_data and chunks_data.get("chunks"):
+        chunks = chunks_data["chunks"]
+        first = page * CHUNK_PAGE_SIZE
+        st.subheader(f"Content Clusters ({chunks_data['total']})")
+
+        # The whole page is one escaped HTML grid (one element, not three per
+        # card); previews arrive on one line, so blank lines can't end the HTML block
+        cards = []
+        for k, chunk in enumerate(chunks):
+            cards.append(
+                f'<div class="chunk-card"><div class="chunk-header"><span>Chunk {first + k + 1}</span>'
+                f'<span>Pg {escape(str(chunk["metadata"].get("page", "N/A")))}</span></div>'
+                f'<div class="chunk-content">{escape(chunk["text"])}</div></div>'
+            )
+        st.markdown(f'<div class="chunk-grid">{"".join(cards)}</div>', unsafe_allow_html=True)
+
+        # One selector for the whole page instead of a Zoom button per card
+        st.pills(
+            "🔍 Zoom into chunk", options=list(range(len(chunks))),
+            format_func=lambda k: f"Chunk {first + k + 1}",
+            key="chunk_zoom", on_change=zoom_chunk
+        )
+        if st.session_state.get("zoomed_chunk") is not None:
+            show_chunk_detail(doc_id, chunks[st.session_state.pop("zoomed_chunk")])
+
+        page_count = -(-chunks_data["total"] // CHUNK_PAGE_SIZE)
+        if page_count > 1:
+            col_prev, col_page, col_next = st.columns([1, 2, 1])
+            with col_prev:
+                st.button(
+                    "◀ Prev", disabled=page == 0, use_container_width=True,
+                    on_click=set_chunks_page, args=(page - 1,)
+                )
+            with col_page:
+                st.caption(f"Page {page + 1}/{page_count}")
+            with col_next:
+                st.button(
+                    "Next ▶", disabled=page >= page_count - 1, use_container_width=True,
+                    on_click=set_chunks_page, args=(page + 1,)
+                )
+    else:
+        st.warning("No chunks found.")
+
 def main():
-    st.title("📚 Document Library")
-    st.markdown("Upload and manage your research documents.")
+    col_title, col_refresh = st.columns([5, 1])
+    with col_title:
+        st.title("📚 Document Library")
+        st.markdown("Upload and manage your research documents.")
+    with col_refresh:
+        st.button("🔄 Refresh", use_container_width=True, help="Reload documents and chunks", on_click=clear_cache)
 
     # 1. Upload Section
     if "lib_uploader_key" not in st.session_state:
@@ -262,11 +334,9 @@ def main():
         if uploaded_file:
             if uploaded_file.type == "application/pdf":
                 st.markdown("#### Preview")
-                preview_images = get_pdf_preview(uploaded_file.getvalue())
-                if preview_images:
-                    cols = st.columns(3)
-                    for i, img in enumerate(preview_images[:3]):
-                        with cols[i]: st.image(img, use_container_width=True, caption=f"Page {i+1}")
+                cols = st.columns(PREVIEW_PAGES)
+                for i, img in get_pdf_preview(uploaded_file, max_pages=PREVIEW_PAGES):
+                    with cols[i]: st.image(img, use_container_width=True, caption=f"Page {i+1}")
             
             if st.button("🚀 Process & Index Document", type="primary", use_container_width=True):
                 with st.spinner("Processing document..."):
@@ -280,6 +350,11 @@ def main():
     st.markdown("---")
 
     # 2. Document Selection & Management
+    # The last selected document is most likely still selected: warm its
+    # current chunk page while the document list loads. A failed prefetch is retried
+    # (and reported) by the foreground fetch below.
+    if st.session_state.get("lib_doc_id"):
+        get_executor().submit(_fetch_document_chunks, st.session_state.lib_doc_id, st.session_state.chunks_page)
     docs_data = get_documents()
     docs = docs_data.get("documents", [])
     
@@ -288,9 +363,13 @@ def main():
         return
 
     st.subheader(f"🗂️ Manage Documents ({len(docs)})")
-    doc_options = {f"{doc['filename']} ({doc['document_id'][:8]})": doc for doc in docs}
+    labels = doc_labels(tuple((doc['document_id'], doc['filename']) for doc in docs))
+    doc_options = dict(zip(labels, docs))
     selected_doc_name = st.selectbox("Select a document to inspect:", options=list(doc_options.keys()))
     selected_doc = doc_options[selected_doc_name]
+    if st.session_state.get("lib_doc_id") != selected_doc['document_id']:
+        st.session_state.chunks_page = 0
+    st.session_state.lib_doc_id = selected_doc['document_id']
 
     # Quick Actions
     col_info, col_edit, col_del = st.columns([3, 1, 1])
@@ -312,27 +391,7 @@ def main():
         display_metadata(selected_doc)
         
     with tab_chunks:
-        with st.spinner("Loading chunks..."):
-            chunks_data = get_document_chunks(selected_doc['document_id'])
-        
-        if chunks_data and chunks_data.get("chunks"):
-            chunks = chunks_data["chunks"]
-            st.subheader(f"Content Clusters ({len(chunks)})")
-            
-            cols_per_row = 3
-            for i in range(0, len(chunks), cols_per_row):
-                row_chunks = chunks[i:i + cols_per_row]
-                cols = st.columns(cols_per_row)
-                for j, chunk in enumerate(row_chunks):
-                    with cols[j]:
-                        st.markdown(f'<div class="chunk-header"><span>Chunk {i+j+1}</span><span>Pg {chunk["metadata"].get("page", "N/A")}</span></div>', unsafe_allow_html=True)
-                        preview_text = chunk['text'][:400] + "..." if len(chunk['text']) > 400 else chunk['text']
-                        st.markdown(f'<div class="chunk-content">{preview_text}</div>', unsafe_allow_html=True)
-                        if st.button("🔍 Zoom", key=f"btn_{chunk['chunk_id']}"):
-                            show_chunk_detail(chunk)
-                        st.markdown('<div style="height: 20px;"></div>', unsafe_allow_html=True)
-        else:
-            st.warning("No chunks found.")
+        render_chunks(selected_doc['document_id'])
 
 if __name__ == "__main__":
     main()
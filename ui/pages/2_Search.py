@@ -1,11 +1,17 @@
-import os
-import streamlit as st
-import requests
 import re
+import streamlit as st
+from html import escape
 from datetime import datetime
+from lib import BACKEND_API_URL, format_latex, get_session, json_loads, keyword_chips, load_css
+
+# (connect, read) timeouts; hybrid search waits on embedding and reranking
+REQUEST_TIMEOUT = (3, 30)
 
-# API Configuration
-BACKEND_API_URL = os.getenv("BACKEND_API_URL", "http://localhost:8000")
+# Results fetched per content search; the top_k slider slices locally
+MAX_TOP_K = 20
+
+# Initial position of the document tab's year slider
+DEFAULT_YEAR_RANGE = (2000, 2030)
 
 # Page config
 st.set_page_config(
@@ -14,199 +20,229 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
-<style>
-    .search-container {
-        background-color: #f8f9fa;
-        padding: 2rem;
-        border-radius: 1rem;
-        margin-bottom: 2rem;
-        border: 1px solid #e9ecef;
-    }
-    .result-card {
-        background-color: white;
-        padding: 1.5rem;
-        border-radius: 0.8rem;
-        border-left: 5px solid #1E88E5;
-        margin-bottom: 1.5rem;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-    }
-    .result-score {
-        background-color: #E3F2FD;
-        color: #1E88E5;
-        padding: 2px 10px;
-        border-radius: 10px;
-        font-size: 0.8rem;
-        font-weight: bold;
-    }
-    .source-info {
-        font-size: 0.85rem;
-        color: #666;
-        margin-top: 10px;
-    }
-    .search-tabs {
-        margin-bottom: 20px;
-    }
-    .document-card {
-        border: 1px solid #eee;
-        border-radius: 8px;
-        padding: 15px;
-        margin-bottom: 10px;
-        transition: transform 0.2s;
-    }
-    .document-card:hover {
-        border-color: #1E88E5;
-        transform: scale(1.01);
-    }
-</style>
-""", unsafe_allow_html=True)
-
-def format_latex(text: str) -> str:
-    if not text:
-        return text
-    text = re.sub(r'\\\[(.*?)\\\]', r'$$\1$$', text, flags=re.DOTALL)
-    text = re.sub(r'\\\((.*?)\\\)', r'$\1$', text, flags=re.DOTALL)
-    return text
+# Custom CSS (re-emitted every run: Streamlit drops elements a rerun skips)
+st.markdown(load_css("search.css"), unsafe_allow_html=True)
+
+@st.cache_data(ttl=300, max_entries=256, show_spinner=False)
+def _fetch_semantic_search(query_key, top_k, search_type, _query):
+    # Cached on the normalized query_key; the leading underscore keeps the
+    # user's own wording (what the backend actually searches) out of the key
+    response = get_session().post(
+        f"{BACKEND_API_URL}/search",
+        json={
+            "query": _query,
+            "top_k": top_k,
+            "search_type": search_type
+        },
+        timeout=REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    return json_loads(response.content)
+
+@st.cache_data(ttl=300, max_entries=256, show_spinner=False)
+def _fetch_document_search(query, authors, year_min, year_max, keywords):
+    payload = {}
+    if query: payload["query"] = query
+    if authors: payload["authors"] = authors
+    if year_min: payload["year_min"] = year_min
+    if year_max: payload["year_max"] = year_max
+    if keywords: payload["keywords"] = keywords
+    
+    response = get_session().post(f"{BACKEND_API_URL}/documents/search", json=payload, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return json_loads(response.content)
+
+def clear_cache():
+    _fetch_semantic_search.clear()
+    _fetch_document_search.clear()
+    st.session_state.pop("last_search", None)
+
+def normalize_query(query):
+    # Cache key only: "What is attention?" and "what is  attention" share one
+    # entry, but the backend is always sent the query as the user typed it
+    return " ".join(query.split()).rstrip("?.! ").lower()
 
 def semantic_search(query, top_k=5, search_type="hybrid"):
     try:
-        response = requests.post(
-            f"{BACKEND_API_URL}/search",
-            json={
-                "query": query,
-                "top_k": top_k,
-                "search_type": search_type
-            }
-        )
-        response.raise_for_status()
-        return response.json()
+        return _fetch_semantic_search(normalize_query(query), top_k, search_type, query)
     except Exception as e:
         st.error(f"Error in content search: {e}")
         return None
 
 def document_search(query=None, authors=None, year_min=None, year_max=None, keywords=None):
     try:
-        payload = {}
-        if query: payload["query"] = query
-        if authors: payload["authors"] = authors
-        if year_min: payload["year_min"] = year_min
-        if year_max: payload["year_max"] = year_max
-        if keywords: payload["keywords"] = keywords
-        
-        response = requests.post(f"{BACKEND_API_URL}/documents/search", json=payload)
-        response.raise_for_status()
-        return response.json()
+        return _fetch_document_search(query, authors, year_min, year_max, keywords)
     except Exception as e:
         st.error(f"Error in document search: {e}")
         return None
 
-def main():
-    st.title("🔍 Smart Search")
-    st.markdown("Search for specific content chunks or discover documents by metadata.")
+def html_text(value):
+    # Escaped, single-line text for the card HTML; quote escaping is skipped
+    # since no data goes into attributes
+    return " ".join(escape(str(value), quote=False).split())
 
-    tab1, tab2 = st.tabs(["📄 Content Search", "📚 Document Discovery"])
+# Display math left by format_latex, and bare LaTeX environments
+MATH_BLOCK_PATTERN = re.compile(r'\$\$.*?\$\$|\\begin\{([^}]*)\}.*?\\end\{\1\}', re.DOTALL)
 
-    with tab1:
-        st.markdown("### Search across all document contents")
-        
-        with st.container():
-            col1, col2 = st.columns([4, 1])
-            with col1:
-                q = st.text_input("Enter your query (e.g., 'What is the attention mechanism?')", key="content_q")
-            with col2:
-                search_type = st.selectbox("Method", ["hybrid", "vector", "bm25"], key="method")
-        
-        top_k = st.slider("Number of results", 1, 20, 5)
-        
-        if q:
+def _html_lines(text):
+    # Each source line collapsed and escaped, joined with <br> (so a paragraph
+    # break becomes <br><br>)
+    return "<br>".join(html_text(line) for line in text.split("\n"))
+
+def html_multiline(text):
+    # Escaped card text that keeps its line breaks: newlines become <br>
+    # outside math blocks and stay as-is inside them, so multi-line formulas
+    # keep their layout. Blank lines inside math are dropped, since a blank
+    # line would end the card's HTML block early.
+    if "\n" not in text:
+        return html_text(text)
+    parts = []
+    last = 0
+    for match in MATH_BLOCK_PATTERN.finditer(text):
+        parts.append(_html_lines(text[last:match.start()]))
+        parts.append("\n".join(
+            escape(line, quote=False) for line in match.group(0).splitlines() if line.strip()
+        ))
+        last = match.end()
+    parts.append(_html_lines(text[last:]))
+    return "".join(parts)
+
+# Each tab is a fragment: its widgets rerun only that tab, never the other one
+@st.fragment
+def render_content_search():
+    st.markdown("### Search across all document contents")
+    
+    col1, col2 = st.columns([4, 1])
+    with col1:
+        q = st.text_input("Enter your query (e.g., 'What is the attention mechanism?')", key="content_q")
+    with col2:
+        search_type = st.selectbox("Method", ["hybrid", "vector", "bm25"], key="method")
+    
+    top_k = st.slider("Number of results", 1, MAX_TOP_K, 5)
+    
+    query_key = normalize_query(q)
+    if query_key:
+        # Always fetch the slider's maximum and slice, so moving the slider never
+        # re-queries; reruns that don't change the inputs reuse the last results
+        search_key = (query_key, search_type)
+        last_search = st.session_state.get("last_search")
+        if last_search and last_search[0] == search_key:
+            results = last_search[1]
+        else:
             with st.spinner("Searching..."):
-                results = semantic_search(q, top_k, search_type)
-                
-                if results and results.get("results"):
-                    st.success(f"Found {len(results['results'])} relevant chunks")
-                    
-                    for i, res in enumerate(results["results"]):
-                        meta = res.get("metadata", {})
-                        with st.container():
-                            st.markdown(f"""
-                            <div class="result-card">
-                                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;">
-                                    <span style="font-weight: bold; color: #333;">Result #{i+1}</span>
-                                    <span class="result-score">Score: {res['score']:.4f}</span>
-                                </div>
-                                <div style="font-size: 0.95rem; line-height: 1.6;">
-                                    {format_latex(res['text'])}
-                                </div>
-                                <div class="source-info">
-                                    📍 <b>{meta.get('filename', 'Unknown')}</b> | Page {meta.get('page', 'N/A')} | {meta.get('file_type', '').upper()}
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
-                else:
-                    st.info("No content matches found.")
+                results = semantic_search(q, MAX_TOP_K, search_type)
+            if results is not None:
+                st.session_state.last_search = (search_key, results)
 
-    with tab2:
-        st.markdown("### Find documents by metadata")
-        
-        with st.container():
-            col_d1, col_d2 = st.columns([3, 1])
-            with col_d1:
-                doc_q = st.text_input("Global search (filename, authors, keywords...)", key="doc_q")
-            with col_d2:
-                st.markdown("<br>", unsafe_allow_html=True)
-                do_doc_search = st.button("🔎 Search Documents", use_container_width=True, type="primary")
+        hits = results["results"][:top_k] if results else None
+        if hits:
+            st.success(f"Found {len(hits)} relevant chunks")
+
+            # All cards go out as one HTML block, one element instead of one per
+            # card; html_text/html_multiline never emit a blank line, which would end it early
+            cards = []
+            for i, res in enumerate(hits):
+                meta = res.get("metadata", {})
+                cards.append(
+                    f'<div class="result-card">'
+                    f'<div class="result-header">'
+                    f'<span class="result-rank">Result #{i+1}</span>'
+                    f'<span class="result-score">Score: {res["score"]:.4f}</span></div>'
+                    f'<div class="result-text">{html_multiline(format_latex(res["text"]))}</div>'
+                    f'<div class="source-info">📍 <b>{html_text(meta.get("filename", "Unknown"))}</b> | '
+                    f'Page {html_text(meta.get("page", "N/A"))} | {html_text(meta.get("file_type", "").upper())}</div>'
+                    f'</div>'
+                )
+            st.markdown("".join(cards), unsafe_allow_html=True)
+        else:
+            st.info("No content matches found.")
+
+@st.fragment
+def render_document_search():
+    st.markdown("### Find documents by metadata")
+    
+    # A form batches the inputs so typing or moving the slider doesn't
+    # hit the API; the search only runs when the form is submitted.
+    with st.form("search_form", clear_on_submit=False):
+        col_d1, col_d2 = st.columns([3, 1])
+        with col_d1:
+            doc_q = st.text_input("Global search (filename, authors, keywords...)", key="doc_q")
+        with col_d2:
+            st.markdown("<br>", unsafe_allow_html=True)
+            submitted = st.form_submit_button("🔎 Search Documents", use_container_width=True, type="primary")
         
         with st.expander("Advanced Metadata Filters"):
             col_f1, col_f2, col_f3 = st.columns(3)
             with col_f1:
                 f_authors = st.text_input("Authors")
             with col_f2:
-                f_year_range = st.slider("Year Range", 1990, 2030, (2000, 2030), key="year_slide")
+                f_year_range = st.slider("Year Range", 1990, 2030, DEFAULT_YEAR_RANGE, key="year_slide")
             with col_f3:
                 f_keywords = st.text_input("Keywords (comma-separated)")
-        
-        if do_doc_search or doc_q or f_authors or f_keywords:
+    
+    if submitted:
+        # The untouched year range means "any year", not a filter
+        year_active = f_year_range != DEFAULT_YEAR_RANGE
+        if not (doc_q or f_authors or f_keywords or year_active):
+            st.session_state.pop("doc_results", None)
+            st.info("Enter a search term or set a filter to find documents.")
+        else:
             with st.spinner("Finding documents..."):
-                y_min, y_max = f_year_range
-                docs_data = document_search(
+                y_min, y_max = f_year_range if year_active else (None, None)
+                doc_results = document_search(
                     query=doc_q if doc_q else None,
                     authors=f_authors if f_authors else None,
                     year_min=y_min,
                     year_max=y_max,
                     keywords=f_keywords if f_keywords else None
                 )
-                
-                if docs_data and docs_data.get("documents"):
-                    st.info(f"Found {docs_data['total']} documents")
-                    
-                    for doc in docs_data["documents"]:
-                        with st.container():
-                            st.markdown(f"""
-                            <div class="document-card">
-                                <div style="display: flex; justify-content: space-between;">
-                                    <span style="font-weight: bold; font-size: 1.1rem; color: #1E88E5;">{doc['filename']}</span>
-                                    <span style="color: #666; font-size: 0.8rem;">{doc['upload_timestamp']}</span>
-                                </div>
-                                <div style="margin-top: 5px; font-size: 0.9rem;">
-                                    <b>Authors:</b> {doc.get('authors') or 'N/A'} | <b>Year:</b> {doc.get('year') or 'N/A'}
-                                </div>
-                                <div style="margin-top: 5px; font-size: 0.85rem; color: #444;">
-                                    <b>Venue:</b> {doc.get('venue') or 'N/A'}
-                                </div>
-                                <div style="margin-top: 8px;">
-                                    {" ".join([f'<span style="background: #eee; padding: 2px 8px; border-radius: 10px; font-size: 0.75rem; margin-right: 5px;">{k.strip()}</span>' for k in (doc.get('keywords') or '').split(',') if k.strip()])}
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            with st.expander("View Abstract"):
-                                if doc.get('abstract'):
-                                    st.write(doc['abstract'])
-                                else:
-                                    st.write("No abstract available.")
-                else:
-                    st.info("No documents found matching the criteria.")
+            # A failed search has already shown its error; don't follow it
+            # with "No documents found" (or replace the last good results)
+            if doc_results is not None:
+                st.session_state.doc_results = doc_results
+    
+    # Keep the last submitted results on screen across unrelated reruns
+    if "doc_results" in st.session_state:
+        docs_data = st.session_state.doc_results
+
+        if docs_data and docs_data.get("documents"):
+            st.info(f"Found {docs_data['total']} documents")
+
+            # Same single-block approach; abstracts use <details> rather than
+            # an st.expander per card so they can stay inside the block
+            cards = []
+            for doc in docs_data["documents"]:
+                cards.append(
+                    f'<div class="document-card">'
+                    f'<div class="doc-header">'
+                    f'<span class="doc-title">{html_text(doc["filename"])}</span>'
+                    f'<span class="doc-date">{html_text(doc["upload_timestamp"])}</span></div>'
+                    f'<div class="doc-authors">'
+                    f'<b>Authors:</b> {html_text(doc.get("authors") or "N/A")} | <b>Year:</b> {html_text(doc.get("year") or "N/A")}</div>'
+                    f'<div class="doc-venue"><b>Venue:</b> {html_text(doc.get("venue") or "N/A")}</div>'
+                    f'<div class="doc-keywords">{keyword_chips(doc.get("keywords") or "")}</div>'
+                    f'<details class="abstract"><summary>View Abstract</summary><p>{html_text(doc.get("abstract") or "No abstract available.")}</p></details>'
+                    f'</div>'
+                )
+            st.markdown("".join(cards), unsafe_allow_html=True)
+        else:
+            st.info("No documents found matching the criteria.")
+
+def main():
+    col_title, col_refresh = st.columns([5, 1])
+    with col_title:
+        st.title("🔍 Smart Search")
+        st.markdown("Search for specific content chunks or discover documents by metadata.")
+    with col_refresh:
+        st.button("🔄 Clear cache", use_container_width=True, help="Forget cached search results", on_click=clear_cache)
+
+    tab1, tab2 = st.tabs(["📄 Content Search", "📚 Document Discovery"])
+
+    with tab1:
+        render_content_search()
+
+    with tab2:
+        render_document_search()
 
 if __name__ == "__main__":
     main()